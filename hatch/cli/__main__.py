@@ -34,6 +34,8 @@ Example:
 """
 
 import argparse
+import functools
+import importlib
 import logging
 import sys
 from pathlib import Path
@@ -852,162 +854,169 @@ def _setup_mcp_commands(subparsers):
     )
 
 
+# Handler dispatch tables: subcommand -> (module, handler name). Handler
+# modules are imported only when their command is actually selected.
+_ENV_HANDLERS = {
+    "create": ("hatch.cli.cli_env", "handle_env_create"),
+    "remove": ("hatch.cli.cli_env", "handle_env_remove"),
+    "list": ("hatch.cli.cli_env", "handle_env_list"),
+    "use": ("hatch.cli.cli_env", "handle_env_use"),
+    "current": ("hatch.cli.cli_env", "handle_env_current"),
+    "show": ("hatch.cli.cli_env", "handle_env_show"),
+}
+
+_ENV_LIST_HANDLERS = {
+    "hosts": ("hatch.cli.cli_env", "handle_env_list_hosts"),
+    "servers": ("hatch.cli.cli_env", "handle_env_list_servers"),
+}
+
+_ENV_PYTHON_HANDLERS = {
+    "init": ("hatch.cli.cli_env", "handle_env_python_init"),
+    "info": ("hatch.cli.cli_env", "handle_env_python_info"),
+    "remove": ("hatch.cli.cli_env", "handle_env_python_remove"),
+    "shell": ("hatch.cli.cli_env", "handle_env_python_shell"),
+    "add-hatch-mcp": ("hatch.cli.cli_env", "handle_env_python_add_hatch_mcp"),
+}
+
+
+_PACKAGE_HANDLERS = {
+    "add": ("hatch.cli.cli_package", "handle_package_add"),
+    "remove": ("hatch.cli.cli_package", "handle_package_remove"),
+    "list": ("hatch.cli.cli_package", "handle_package_list"),
+    "sync": ("hatch.cli.cli_package", "handle_package_sync"),
+}
+
+# MCP commands without subcommands
+_MCP_HANDLERS = {
+    "configure": ("hatch.cli.cli_mcp", "handle_mcp_configure"),
+    "sync": ("hatch.cli.cli_mcp", "handle_mcp_sync"),
+}
+
+# MCP commands with subcommands: command -> (args attribute holding the
+# subcommand, subcommand handlers, message printed for unknown subcommands)
+_MCP_SUBCOMMAND_HANDLERS = {
+    "discover": (
+        "discover_command",
+        {
+            "hosts": ("hatch.cli.cli_mcp", "handle_mcp_discover_hosts"),
+            "servers": ("hatch.cli.cli_mcp", "handle_mcp_discover_servers"),
+        },
+        "Unknown discover command",
+    ),
+    "list": (
+        "list_command",
+        {
+            "hosts": ("hatch.cli.cli_mcp", "handle_mcp_list_hosts"),
+            "servers": ("hatch.cli.cli_mcp", "handle_mcp_list_servers"),
+        },
+        "Unknown list command",
+    ),
+    "show": (
+        "show_command",
+        {
+            "hosts": ("hatch.cli.cli_mcp", "handle_mcp_show_hosts"),
+            "servers": ("hatch.cli.cli_mcp", "handle_mcp_show_servers"),
+        },
+        "Unknown show command. Use 'hatch mcp show hosts' or 'hatch mcp show servers'",
+    ),
+    "backup": (
+        "backup_command",
+        {
+            "restore": ("hatch.cli.cli_mcp", "handle_mcp_backup_restore"),
+            "list": ("hatch.cli.cli_mcp", "handle_mcp_backup_list"),
+            "clean": ("hatch.cli.cli_mcp", "handle_mcp_backup_clean"),
+        },
+        "Unknown backup command",
+    ),
+    "remove": (
+        "remove_command",
+        {
+            "server": ("hatch.cli.cli_mcp", "handle_mcp_remove_server"),
+            "host": ("hatch.cli.cli_mcp", "handle_mcp_remove_host"),
+        },
+        "Unknown remove command",
+    ),
+}
+
+
+def _run_handler(handler_ref, args):
+    """Import the referenced handler lazily and invoke it.
+
+    Args:
+        handler_ref: Tuple of (module name, handler function name)
+        args: Parsed arguments passed to the handler
+
+    Returns:
+        Exit code returned by the handler
+    """
+    module_name, handler_name = handler_ref
+    return getattr(importlib.import_module(module_name), handler_name)(args)
+
+
 def _route_env_command(args):
     """Route environment commands to handlers."""
-    from hatch.cli.cli_env import (
-        handle_env_create,
-        handle_env_remove,
-        handle_env_list,
-        handle_env_list_hosts,
-        handle_env_list_servers,
-        handle_env_use,
-        handle_env_current,
-        handle_env_show,
-        handle_env_python_init,
-        handle_env_python_info,
-        handle_env_python_remove,
-        handle_env_python_shell,
-        handle_env_python_add_hatch_mcp,
-    )
-
-    if args.env_command == "create":
-        return handle_env_create(args)
-    elif args.env_command == "remove":
-        return handle_env_remove(args)
-    elif args.env_command == "list":
+    if args.env_command == "list":
         # Check for subcommand (hosts, servers) or default list behavior
         list_command = getattr(args, "list_command", None)
-        if list_command == "hosts":
-            return handle_env_list_hosts(args)
-        elif list_command == "servers":
-            return handle_env_list_servers(args)
-        else:
-            # Default: list environments
-            return handle_env_list(args)
-    elif args.env_command == "use":
-        return handle_env_use(args)
-    elif args.env_command == "current":
-        return handle_env_current(args)
-    elif args.env_command == "show":
-        return handle_env_show(args)
+        if list_command in _ENV_LIST_HANDLERS:
+            return _run_handler(_ENV_LIST_HANDLERS[list_command], args)
+        # Default: list environments
+        return _run_handler(_ENV_HANDLERS["list"], args)
     elif args.env_command == "python":
-        if args.python_command == "init":
-            return handle_env_python_init(args)
-        elif args.python_command == "info":
-            return handle_env_python_info(args)
-        elif args.python_command == "remove":
-            return handle_env_python_remove(args)
-        elif args.python_command == "shell":
-            return handle_env_python_shell(args)
-        elif args.python_command == "add-hatch-mcp":
-            return handle_env_python_add_hatch_mcp(args)
-        else:
+        handler_ref = _ENV_PYTHON_HANDLERS.get(args.python_command)
+        if handler_ref is None:
             print("Unknown Python environment command")
             return 1
-    else:
+        return _run_handler(handler_ref, args)
+
+    handler_ref = _ENV_HANDLERS.get(args.env_command)
+    if handler_ref is None:
         print("Unknown environment command")
         return 1
+    return _run_handler(handler_ref, args)
 
 
 def _route_package_command(args):
     """Route package commands to handlers."""
-    from hatch.cli.cli_package import (
-        handle_package_add,
-        handle_package_remove,
-        handle_package_list,
-        handle_package_sync,
-    )
-
-    if args.pkg_command == "add":
-        return handle_package_add(args)
-    elif args.pkg_command == "remove":
-        return handle_package_remove(args)
-    elif args.pkg_command == "list":
-        return handle_package_list(args)
-    elif args.pkg_command == "sync":
-        return handle_package_sync(args)
-    else:
+    handler_ref = _PACKAGE_HANDLERS.get(args.pkg_command)
+    if handler_ref is None:
         print("Unknown package command")
         return 1
+    return _run_handler(handler_ref, args)
 
 
 def _route_mcp_command(args):
     """Route MCP commands to handlers."""
-    from hatch.cli.cli_mcp import (
-        handle_mcp_discover_hosts,
-        handle_mcp_discover_servers,
-        handle_mcp_list_hosts,
-        handle_mcp_list_servers,
-        handle_mcp_show_hosts,
-        handle_mcp_show_servers,
-        handle_mcp_backup_restore,
-        handle_mcp_backup_list,
-        handle_mcp_backup_clean,
-        handle_mcp_configure,
-        handle_mcp_remove_server,
-        handle_mcp_remove_host,
-        handle_mcp_sync,
-    )
-
-    if args.mcp_command == "discover":
-        if args.discover_command == "hosts":
-            return handle_mcp_discover_hosts(args)
-        elif args.discover_command == "servers":
-            return handle_mcp_discover_servers(args)
-        else:
-            print("Unknown discover command")
-            return 1
+    handler_ref = _MCP_HANDLERS.get(args.mcp_command)
+    if handler_ref is not None:
+        return _run_handler(handler_ref, args)
 
-    elif args.mcp_command == "list":
-        if args.list_command == "hosts":
-            return handle_mcp_list_hosts(args)
-        elif args.list_command == "servers":
-            return handle_mcp_list_servers(args)
-        else:
-            print("Unknown list command")
-            return 1
-
-    elif args.mcp_command == "show":
-        show_command = getattr(args, "show_command", None)
-        if show_command == "hosts":
-            return handle_mcp_show_hosts(args)
-        elif show_command == "servers":
-            return handle_mcp_show_servers(args)
-        else:
-            print(
-                "Unknown show command. Use 'hatch mcp show hosts' or 'hatch mcp show servers'"
-            )
-            return 1
-
-    elif args.mcp_command == "backup":
-        if args.backup_command == "restore":
-            return handle_mcp_backup_restore(args)
-        elif args.backup_command == "list":
-            return handle_mcp_backup_list(args)
-        elif args.backup_command == "clean":
-            return handle_mcp_backup_clean(args)
-        else:
-            print("Unknown backup command")
-            return 1
-
-    elif args.mcp_command == "configure":
-        return handle_mcp_configure(args)
+    if args.mcp_command not in _MCP_SUBCOMMAND_HANDLERS:
+        print("Unknown MCP command")
+        return 1
 
-    elif args.mcp_command == "remove":
-        if args.remove_command == "server":
-            return handle_mcp_remove_server(args)
-        elif args.remove_command == "host":
-            return handle_mcp_remove_host(args)
-        else:
-            print("Unknown remove command")
-            return 1
+    subcommand_attr, handlers, unknown_message = _MCP_SUBCOMMAND_HANDLERS[
+        args.mcp_command
+    ]
+    handler_ref = handlers.get(getattr(args, subcommand_attr, None))
+    if handler_ref is None:
+        print(unknown_message)
+        return 1
+    return _run_handler(handler_ref, args)
 
-    elif args.mcp_command == "sync":
-        return handle_mcp_sync(args)
 
-    else:
-        print("Unknown MCP command")
-        return 1
+# Top-level command routing: command -> callable taking the parsed args
+_COMMANDS = {
+    "create": functools.partial(
+        _run_handler, ("hatch.cli.cli_system", "handle_create")
+    ),
+    "validate": functools.partial(
+        _run_handler, ("hatch.cli.cli_system", "handle_validate")
+    ),
+    "env": _route_env_command,
+    "package": _route_package_command,
+    "mcp": _route_mcp_command,
+}
 
 
 def main() -> int:
@@ -1049,8 +1058,9 @@ def main() -> int:
     # General arguments for the environment manager
     parser.add_argument(
         "--envs-dir",
-        default=Path.home() / ".hatch" / "envs",
-        help="Directory to store environments",
+        type=Path,
+        default=None,
+        help="Directory to store environments (default: ~/.hatch/envs)",
     )
     parser.add_argument(
         "--cache-ttl",
@@ -1060,8 +1070,9 @@ def main() -> int:
     )
     parser.add_argument(
         "--cache-dir",
-        default=Path.home() / ".hatch" / "cache",
-        help="Directory to store cached packages",
+        type=Path,
+        default=None,
+        help="Directory to store cached packages (default: ~/.hatch/cache)",
     )
     parser.add_argument(
         "--log-level",
@@ -1073,14 +1084,22 @@ def main() -> int:
     args = parser.parse_args()
     logging.getLogger().setLevel(getattr(logging, args.log_level))
 
+    # Unknown or missing command: show help without initializing managers
+    if args.command not in _COMMANDS:
+        parser.print_help()
+        return 1
+
     # Initialize managers (lazy - only when needed)
     from hatch.environment_manager import HatchEnvironmentManager
     from hatch.mcp_host_config import MCPHostConfigurationManager
 
+    # Directory defaults are resolved only after parsing, so building the
+    # parser (e.g. for --help) never touches the home directory
+    hatch_home = Path.home() / ".hatch"
     env_manager = HatchEnvironmentManager(
-        environments_dir=args.envs_dir,
+        environments_dir=args.envs_dir or hatch_home / "envs",
         cache_ttl=args.cache_ttl,
-        cache_dir=args.cache_dir,
+        cache_dir=args.cache_dir or hatch_home / "cache",
     )
     mcp_manager = MCPHostConfigurationManager()
 
@@ -1089,28 +1108,7 @@ def main() -> int:
     args.mcp_manager = mcp_manager
 
     # Route commands
-    if args.command == "create":
-        from hatch.cli.cli_system import handle_create
-
-        return handle_create(args)
-
-    elif args.command == "validate":
-        from hatch.cli.cli_system import handle_validate
-
-        return handle_validate(args)
-
-    elif args.command == "env":
-        return _route_env_command(args)
-
-    elif args.command == "package":
-        return _route_package_command(args)
-
-    elif args.command == "mcp":
-        return _route_mcp_command(args)
-
-    else:
-        parser.print_help()
-        return 1
+    return _COMMANDS[args.command](args)
 
 
 if __name__ == "__main__":
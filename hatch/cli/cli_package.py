@@ -21,6 +21,8 @@ Handler Signature:
     - Returns: EXIT_SUCCESS (0) on success, EXIT_ERROR (1) on failure
 
 Internal Helpers:
+    _resolve_package_server_configs(): Resolve MCP server configs for packages
+    _configure_one_host(): Configure all package servers on a single host
     _configure_packages_on_hosts(): Shared logic for configuring packages on hosts
 
 Example:
@@ -31,8 +33,9 @@ Example:
 
 import json
 from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Tuple, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 
 from hatch_validator.package.package_service import PackageService
 
@@ -45,13 +48,14 @@ from hatch.cli.cli_utils import (
     ResultReporter,
     ConsequenceType,
     format_warning,
+    format_warnings,
     format_info,
     format_validation_error,
     ValidationError,
+    _MCP_HOST_BY_VALUE,
 )
 from hatch.mcp_host_config import (
     MCPHostConfigurationManager,
-    MCPHostType,
     MCPServerConfig,
 )
 from hatch.mcp_host_config.reporting import generate_conversion_report
@@ -59,6 +63,9 @@ from hatch.mcp_host_config.reporting import generate_conversion_report
 if TYPE_CHECKING:
     from hatch.environment_manager import HatchEnvironmentManager
 
+# Upper bound on hosts configured concurrently by package add/sync
+_MAX_HOST_WORKERS = 8
+
 
 def handle_package_remove(args: Namespace) -> int:
     """Handle 'hatch package remove' command.
@@ -141,14 +148,94 @@ def handle_package_list(args: Namespace) -> int:
         print(f"No packages found in environment: {env}")
         return EXIT_SUCCESS
 
-    print(f"Packages in environment '{env}':")
-    for pkg in packages:
-        print(
-            f"{pkg['name']} ({pkg['version']})\tHatch compliant: {pkg['hatch_compliant']}\tsource: {pkg['source']['uri']}\tlocation: {pkg['source']['path']}"
-        )
+    lines = [f"Packages in environment '{env}':"]
+    lines.extend(
+        f"{pkg['name']} ({pkg['version']})\tHatch compliant: {pkg['hatch_compliant']}\tsource: {pkg['source']['uri']}\tlocation: {pkg['source']['path']}"
+        for pkg in packages
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
     return EXIT_SUCCESS
 
 
+def _local_package_service(
+    package_dir: Path, services: Dict[Path, PackageService]
+) -> PackageService:
+    """Load the PackageService for a local package directory.
+
+    Loaded services are kept in services, a cache owned by the current
+    command, so a package referenced several times (as the main package and
+    as a sibling dependency) is only parsed once per command while edits made
+    between commands are always picked up.
+
+    Args:
+        package_dir: Resolved path to the package directory
+        services: Services already loaded by the current command, by directory
+
+    Returns:
+        PackageService for the package's hatch_metadata.json
+    """
+    service = services.get(package_dir)
+    if service is None:
+        with open(package_dir / "hatch_metadata.json", "r") as f:
+            service = services[package_dir] = PackageService(json.load(f))
+    return service
+
+
+def _installed_package_service(name: str, version: Optional[str]) -> PackageService:
+    """Build a PackageService from the minimal metadata of an installed package.
+
+    Args:
+        name: Package name as recorded in the environment
+        version: Package version as recorded in the environment
+
+    Returns:
+        PackageService for the minimal metadata structure
+    """
+    metadata = {
+        "name": name,
+        "version": version,
+        "dependencies": {},
+    }
+    return PackageService(metadata)
+
+
+def _looks_like_path(name: str) -> bool:
+    """Check whether a dependency name is written as a filesystem path.
+
+    Args:
+        name: Dependency name as listed in package metadata
+
+    Returns:
+        True if the name contains a path separator or starts with '.'
+    """
+    return "/" in name or "\\" in name or name.startswith(".")
+
+
+def _resolve_local_dep_name(dep_name: str, services: Dict[Path, PackageService]) -> str:
+    """Resolve a dependency given as a local path to its package name.
+
+    Args:
+        dep_name: Dependency name or local package path
+        services: Services already loaded by the current command, by directory
+
+    Returns:
+        Package name from the dependency's metadata, or dep_name unchanged
+        if it is not a local package directory or cannot be resolved
+    """
+    # Registry package names never look like paths; skip the stat for them
+    if not _looks_like_path(dep_name):
+        return dep_name
+
+    dep_path = Path(dep_name)
+    if dep_path.is_dir():
+        try:
+            service = _local_package_service(dep_path.resolve(), services)
+            return service.get_field("name")
+        except Exception as e:
+            format_warning(f"Could not resolve dependency path '{dep_name}': {e}")
+    return dep_name
+
+
 def _get_package_names_with_dependencies(
     env_manager: "HatchEnvironmentManager",
     package_path_or_name: str,
@@ -167,31 +254,25 @@ def _get_package_names_with_dependencies(
     package_name = package_path_or_name
     package_service = None
     package_names = []
+    # Local package metadata parsed during this call, by resolved directory
+    services: Dict[Path, PackageService] = {}
 
     # Check if it's a local package path
     pkg_path = Path(package_path_or_name)
     if pkg_path.exists() and pkg_path.is_dir():
         # Local package - load metadata from directory
-        with open(pkg_path / "hatch_metadata.json", "r") as f:
-            metadata = json.load(f)
-            package_service = PackageService(metadata)
+        package_dir = pkg_path.resolve()
+        package_service = _local_package_service(package_dir, services)
         package_name = package_service.get_field("name")
     else:
         # Registry package - get metadata from environment manager
         try:
-            env_data = env_manager.get_environment_data(env_name)
-            if env_data:
-                # Find the package in the environment
-                for pkg in env_data.packages:
-                    if pkg.name == package_name:
-                        # Create a minimal metadata structure for PackageService
-                        metadata = {
-                            "name": pkg.name,
-                            "version": pkg.version,
-                            "dependencies": {},
-                        }
-                        package_service = PackageService(metadata)
-                        break
+            package_index = env_manager.get_environment_package_index(env_name)
+            pkg = package_index.get(package_name)
+            if pkg:
+                package_service = _installed_package_service(
+                    pkg["name"], pkg.get("version")
+                )
 
             if package_service is None:
                 format_warning(
@@ -209,21 +290,12 @@ def _get_package_names_with_dependencies(
         # Get Hatch dependencies
         dependencies = package_service.get_dependencies()
         hatch_deps = dependencies.get("hatch", [])
-        package_names = [dep.get("name") for dep in hatch_deps if dep.get("name")]
+        package_names = [name for dep in hatch_deps if (name := dep.get("name"))]
 
         # Resolve local dependency paths to actual names
-        for i in range(len(package_names)):
-            dep_path = Path(package_names[i])
-            if dep_path.exists() and dep_path.is_dir():
-                try:
-                    with open(dep_path / "hatch_metadata.json", "r") as f:
-                        dep_metadata = json.load(f)
-                        dep_service = PackageService(dep_metadata)
-                    package_names[i] = dep_service.get_field("name")
-                except Exception as e:
-                    format_warning(
-                        f"Could not resolve dependency path '{package_names[i]}': {e}"
-                    )
+        package_names = [
+            _resolve_local_dep_name(name, services) for name in package_names
+        ]
 
     # Add the main package to the list
     package_names.append(package_name)
@@ -231,6 +303,88 @@ def _get_package_names_with_dependencies(
     return package_name, package_names, package_service
 
 
+def _resolve_package_server_configs(
+    env_manager: "HatchEnvironmentManager",
+    env_name: str,
+    package_names: List[str],
+) -> List[Tuple[str, MCPServerConfig]]:
+    """Resolve MCP server configurations for a list of packages.
+
+    Duplicate package names (e.g. shared transitive dependencies) are
+    resolved only once; the first occurrence determines the order.
+
+    Args:
+        env_manager: HatchEnvironmentManager instance
+        env_name: Environment name
+        package_names: List of package names to resolve
+
+    Returns:
+        List of (package_name, server_config) tuples for resolvable packages
+    """
+    server_configs: List[Tuple[str, MCPServerConfig]] = []
+    for pkg_name in dict.fromkeys(package_names):
+        try:
+            config = get_package_mcp_server_config(env_manager, env_name, pkg_name)
+            server_configs.append((pkg_name, config))
+        except Exception as e:
+            format_warning(
+                f"Could not get MCP configuration for package '{pkg_name}': {e}"
+            )
+    return server_configs
+
+
+def _configure_one_host(
+    mcp_manager: MCPHostConfigurationManager,
+    host: str,
+    server_configs: List[Tuple[str, MCPServerConfig]],
+    no_backup: bool,
+) -> Tuple[List[str], List[Tuple[str, Optional[str]]]]:
+    """Configure all package MCP servers on a single host.
+
+    Args:
+        mcp_manager: MCPHostConfigurationManager instance
+        host: Host name to configure on
+        server_configs: List of (package_name, server_config) tuples
+        no_backup: Skip backup creation
+
+    Returns:
+        Tuple of (configured_package_names, warnings) where warnings are
+        (message, suggestion) tuples for format_warnings()
+    """
+    configured: List[str] = []
+    warnings: List[Tuple[str, Optional[str]]] = []
+
+    # One read/backup/write cycle for all servers on this host
+    try:
+        results = mcp_manager.configure_servers(
+            hostname=host,
+            server_configs=[server_config for _, server_config in server_configs],
+            no_backup=no_backup,
+        )
+    except Exception as e:
+        warnings.extend(
+            (
+                f"Error configuring {server_config.name} ({pkg_name}) on {host}",
+                f"Exception: {e}",
+            )
+            for pkg_name, server_config in server_configs
+        )
+        return configured, warnings
+
+    for (pkg_name, server_config), result in zip(server_configs, results):
+        if result.success:
+            configured.append(pkg_name)
+        else:
+            warnings.append(
+                (
+                    f"Failed to configure {server_config.name} ({pkg_name}) on {host}",
+                    f"Reason: {result.error_message}",
+                )
+            )
+
+    return configured, warnings
+
+
 def _configure_packages_on_hosts(
     env_manager: "HatchEnvironmentManager",
     mcp_manager: MCPHostConfigurationManager,
@@ -240,6 +394,7 @@ def _configure_packages_on_hosts(
     no_backup: bool = False,
     dry_run: bool = False,
     reporter: Optional[ResultReporter] = None,
+    server_configs: Optional[List[Tuple[str, MCPServerConfig]]] = None,
 ) -> Tuple[int, int]:
     """Configure MCP servers for packages on specified hosts.
 
@@ -254,98 +409,113 @@ def _configure_packages_on_hosts(
         no_backup: Skip backup creation
         dry_run: Preview only, don't execute
         reporter: Optional ResultReporter for unified output
+        server_configs: Optional pre-resolved (package_name, config) tuples;
+            when given, package_names is not resolved again
 
     Returns:
         Tuple of (success_count, total_operations)
     """
+    if not hosts:
+        return 0, 0
+
     # Get MCP server configurations for all packages
-    server_configs: List[Tuple[str, MCPServerConfig]] = []
-    for pkg_name in package_names:
-        try:
-            config = get_package_mcp_server_config(env_manager, env_name, pkg_name)
-            server_configs.append((pkg_name, config))
-        except Exception as e:
-            format_warning(
-                f"Could not get MCP configuration for package '{pkg_name}': {e}"
-            )
+    if server_configs is None:
+        server_configs = _resolve_package_server_configs(
+            env_manager, env_name, package_names
+        )
 
     if not server_configs:
         return 0, 0
 
     total_operations = len(server_configs) * len(hosts)
     success_count = 0
+    # Per-item warnings are collected and printed together once all hosts
+    # have been processed
+    warnings: List[Tuple[str, Optional[str]]] = []
+    # Host configuration tracking is persisted in a single batch at the end
+    pending_updates: List[Tuple[str, str, dict]] = []
+    tracking_configs = {
+        pkg_name: {
+            "name": server_config.name,
+            "command": server_config.command,
+            "args": server_config.args,
+        }
+        for pkg_name, server_config in server_configs
+    }
 
-    for host in hosts:
-        try:
-            # Convert string to MCPHostType enum
-            host_type = MCPHostType(host)
+    try:
+        valid_hosts: List[str] = []
+        for host in hosts:
+            host_type = _MCP_HOST_BY_VALUE.get(host)
+            if host_type is None:
+                format_validation_error(
+                    ValidationError(
+                        f"Invalid host '{host}'",
+                        field="--host",
+                        suggestion=f"Supported hosts: {', '.join(_MCP_HOST_BY_VALUE)}",
+                    )
+                )
+                continue
+            valid_hosts.append(host)
 
             for pkg_name, server_config in server_configs:
                 try:
-                    # Generate conversion report for field-level details
-                    report = generate_conversion_report(
-                        operation="create",
-                        server_name=server_config.name,
-                        target_host=host_type,
-                        config=server_config,
-                        dry_run=dry_run,
-                    )
-
-                    # Add to reporter if provided
+                    # Generate conversion report for field-level details, only
+                    # when there is a reporter to render it
                     if reporter:
+                        report = generate_conversion_report(
+                            operation="create",
+                            server_name=server_config.name,
+                            target_host=host_type,
+                            config=server_config,
+                            dry_run=dry_run,
+                        )
                         reporter.add_from_conversion_report(report)
 
                     if dry_run:
                         success_count += 1
-                        continue
-
-                    # Pass MCPServerConfig directly - adapters handle serialization
-                    result = mcp_manager.configure_server(
-                        hostname=host,
-                        server_config=server_config,
-                        no_backup=no_backup,
-                    )
-
-                    if result.success:
-                        success_count += 1
-
-                        # Update package metadata with host configuration tracking
-                        try:
-                            server_config_dict = {
-                                "name": server_config.name,
-                                "command": server_config.command,
-                                "args": server_config.args,
-                            }
-
-                            env_manager.update_package_host_configuration(
-                                env_name=env_name,
-                                package_name=pkg_name,
-                                hostname=host,
-                                server_config=server_config_dict,
-                            )
-                        except Exception as e:
-                            format_warning(
-                                f"Failed to update package metadata for {pkg_name}: {e}"
-                            )
-                    else:
-                        format_warning(
-                            f"Failed to configure {server_config.name} ({pkg_name}) on {host}",
-                            suggestion=f"Reason: {result.error_message}",
-                        )
-
                 except Exception as e:
-                    format_warning(
-                        f"Error configuring {server_config.name} ({pkg_name}) on {host}",
-                        suggestion=f"Exception: {e}",
+                    warnings.append(
+                        (
+                            f"Error configuring {server_config.name} ({pkg_name}) on {host}",
+                            f"Exception: {e}",
+                        )
                     )
 
-        except ValueError as e:
-            format_validation_error(
-                ValidationError(
-                    f"Invalid host '{host}'", field="--host", suggestion=str(e)
+        if dry_run or not valid_hosts:
+            return success_count, total_operations
+
+        # Hosts own disjoint configuration files, so they are configured
+        # concurrently; results are consumed in host order
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_HOST_WORKERS, len(valid_hosts))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _configure_one_host, mcp_manager, host, server_configs, no_backup
                 )
-            )
-            continue
+                for host in valid_hosts
+            ]
+            for host, future in zip(valid_hosts, futures):
+                configured, host_warnings = future.result()
+                success_count += len(configured)
+                pending_updates.extend(
+                    (pkg_name, host, tracking_configs[pkg_name])
+                    for pkg_name in configured
+                )
+                warnings.extend(host_warnings)
+    finally:
+        # Update package metadata with host configuration tracking, keeping
+        # successful configurations even if a later one was interrupted
+        if pending_updates:
+            try:
+                env_manager.batch_update_package_host_configurations(
+                    env_name, pending_updates
+                )
+            except Exception as e:
+                warnings.append((f"Failed to update package metadata: {e}", None))
+
+        format_warnings(warnings)
 
     return success_count, total_operations
 
@@ -403,20 +573,27 @@ def handle_package_add(args: Namespace) -> int:
             hosts = parse_host_list(host_arg)
             env_name = env or env_manager.get_current_environment()
 
-            package_name, package_names, _ = _get_package_names_with_dependencies(
-                env_manager, package_path_or_name, env_name
-            )
+            # Only analyse dependencies once there is a host to configure
+            if not hosts:
+                format_warning(
+                    "No MCP hosts available to configure",
+                    suggestion="Skipping MCP host configuration",
+                )
+            else:
+                package_name, package_names, _ = _get_package_names_with_dependencies(
+                    env_manager, package_path_or_name, env_name
+                )
 
-            success_count, total = _configure_packages_on_hosts(
-                env_manager=env_manager,
-                mcp_manager=mcp_manager,
-                env_name=env_name,
-                package_names=package_names,
-                hosts=hosts,
-                no_backup=False,  # Always backup when adding packages
-                dry_run=dry_run,
-                reporter=reporter,
-            )
+                success_count, total = _configure_packages_on_hosts(
+                    env_manager=env_manager,
+                    mcp_manager=mcp_manager,
+                    env_name=env_name,
+                    package_names=package_names,
+                    hosts=hosts,
+                    no_backup=False,  # Always backup when adding packages
+                    dry_run=dry_run,
+                    reporter=reporter,
+                )
 
         except ValueError as e:
             format_warning(f"MCP host configuration failed: {e}")
@@ -462,86 +639,79 @@ def handle_package_sync(args: Namespace) -> int:
         hosts = parse_host_list(host_arg)
         env_name = env or env_manager.get_current_environment()
 
+        # Nothing to sync; skip dependency analysis and config resolution
+        if not hosts:
+            format_warning(
+                "No MCP hosts available to configure",
+                suggestion="Nothing to synchronize",
+            )
+            return EXIT_SUCCESS
+
         # Get all packages to sync (main package + dependencies)
         package_names = [package_name]
 
         # Try to get dependencies for the main package
+        main_package = None
         try:
-            env_data = env_manager.get_environment_data(env_name)
-            if env_data:
-                # Find the main package in the environment
-                main_package = None
-                for pkg in env_data.packages:
-                    if pkg.name == package_name:
-                        main_package = pkg
-                        break
-
-                if main_package:
-                    # Create a minimal metadata structure for PackageService
-                    metadata = {
-                        "name": main_package.name,
-                        "version": main_package.version,
-                        "dependencies": {},
-                    }
-                    package_service = PackageService(metadata)
-
-                    # Get Hatch dependencies
-                    dependencies = package_service.get_dependencies()
-                    hatch_deps = dependencies.get("hatch", [])
-                    dep_names = [
-                        dep.get("name") for dep in hatch_deps if dep.get("name")
-                    ]
-
-                    # Add dependencies to the sync list (before main package)
-                    package_names = dep_names + [package_name]
-                else:
-                    format_warning(
-                        f"Package '{package_name}' not found in environment '{env_name}'",
-                        suggestion="Syncing only the specified package",
-                    )
-            else:
-                format_warning(
-                    f"Could not access environment '{env_name}'",
-                    suggestion="Syncing only the specified package",
-                )
-        except Exception as e:
+            package_index = env_manager.get_environment_package_index(env_name)
+        except KeyError:
             format_warning(
-                f"Could not analyze dependencies for '{package_name}': {e}",
+                f"Could not access environment '{env_name}'",
                 suggestion="Syncing only the specified package",
             )
+        else:
+            main_package = package_index.get(package_name)
+            if not main_package:
+                format_warning(
+                    f"Package '{package_name}' not found in environment '{env_name}'",
+                    suggestion="Syncing only the specified package",
+                )
 
-        # Get MCP server configurations for all packages
-        server_configs: List[Tuple[str, MCPServerConfig]] = []
-        for pkg_name in package_names:
+        if main_package:
             try:
-                config = get_package_mcp_server_config(env_manager, env_name, pkg_name)
-                server_configs.append((pkg_name, config))
+                package_service = _installed_package_service(
+                    package_name, main_package.get("version")
+                )
+
+                # Get Hatch dependencies
+                dependencies = package_service.get_dependencies()
+                hatch_deps = dependencies.get("hatch", [])
+                dep_names = [name for dep in hatch_deps if (name := dep.get("name"))]
+
+                # Add dependencies to the sync list (before main package)
+                package_names = dep_names + [package_name]
             except Exception as e:
                 format_warning(
-                    f"Could not get MCP configuration for package '{pkg_name}': {e}"
+                    f"Could not analyze dependencies for '{package_name}': {e}",
+                    suggestion="Syncing only the specified package",
                 )
 
+        # Get MCP server configurations for all packages
+        server_configs = _resolve_package_server_configs(
+            env_manager, env_name, package_names
+        )
+
         if not server_configs:
             reporter.report_error(
                 f"No MCP server configurations found for package '{package_name}' or its dependencies"
             )
             return EXIT_ERROR
 
-        # Build consequences for preview/confirmation
-        for pkg_name, config in server_configs:
-            for host in hosts:
-                try:
-                    host_type = MCPHostType(host)
-                    report = generate_conversion_report(
-                        operation="create",
-                        server_name=config.name,
-                        target_host=host_type,
-                        config=config,
-                        dry_run=dry_run,
-                    )
-                    reporter.add_from_conversion_report(report)
-                except ValueError:
-                    reporter.add(ConsequenceType.SKIP, f"Invalid host '{host}'")
+        # Build consequences for preview/confirmation, resolving each host once
+        for host in hosts:
+            host_type = _MCP_HOST_BY_VALUE.get(host)
+            if host_type is None:
+                reporter.add(ConsequenceType.SKIP, f"Invalid host '{host}'")
+                continue
+            for pkg_name, config in server_configs:
+                report = generate_conversion_report(
+                    operation="create",
+                    server_name=config.name,
+                    target_host=host_type,
+                    config=config,
+                    dry_run=dry_run,
+                )
+                reporter.add_from_conversion_report(report)
 
         # Show preview and get confirmation
         prompt = reporter.report_prompt()
@@ -567,6 +737,7 @@ def handle_package_sync(args: Namespace) -> int:
             no_backup=no_backup,
             dry_run=False,
             reporter=None,  # Don't add again, we already have consequences
+            server_configs=server_configs,
         )
 
         # Report results
@@ -656,29 +656,31 @@ class ResultReporter:
         if not self._consequences:
             return
 
-        # Print header
+        # Header
         if self._dry_run:
             if _colors_enabled():
-                print(
-                    f"{Color.CYAN.value}[DRY RUN]{Color.RESET.value} Preview of changes:"
-                )
+                header = f"{Color.CYAN.value}[DRY RUN]{Color.RESET.value} Preview of changes:"
             else:
-                print("[DRY RUN] Preview of changes:")
+                header = "[DRY RUN] Preview of changes:"
         else:
             if _colors_enabled():
-                print(
-                    f"{Color.GREEN.value}[SUCCESS]{Color.RESET.value} Operation completed:"
-                )
+                header = f"{Color.GREEN.value}[SUCCESS]{Color.RESET.value} Operation completed:"
             else:
-                print("[SUCCESS] Operation completed:")
+                header = "[SUCCESS] Operation completed:"
+        lines = [header]
 
-        # Print consequences
+        # Consequences
         for consequence in self._consequences:
-            print(self._format_consequence(consequence, use_result_tense=True))
+            lines.append(self._format_consequence(consequence, use_result_tense=True))
             for child in consequence.children:
                 # Optionally filter out UNCHANGED/SKIP in results for noise reduction
                 # For now, show all for transparency
-                print(self._format_consequence(child, use_result_tense=True, indent=4))
+                lines.append(
+                    self._format_consequence(child, use_result_tense=True, indent=4)
+                )
+
+        # Emit the whole report in a single write
+        print("\n".join(lines))
 
     def report_error(self, summary: str, details: Optional[List[str]] = None) -> None:
         """Report execution failure with structured details.
@@ -709,16 +711,17 @@ class ResultReporter:
         if not summary:
             return
 
-        # Print error header with color
+        # Error header with color
         if _colors_enabled():
-            print(f"{Color.RED.value}[ERROR]{Color.RESET.value} {summary}")
+            lines = [f"{Color.RED.value}[ERROR]{Color.RESET.value} {summary}"]
         else:
-            print(f"[ERROR] {summary}")
+            lines = [f"[ERROR] {summary}"]
 
-        # Print details with indentation
+        # Details with indentation
         if details:
-            for detail in details:
-                print(f"  {detail}")
+            lines.extend(f"  {detail}" for detail in details)
+
+        print("\n".join(lines))
 
     def report_partial_success(
         self, summary: str, successes: List[str], failures: List[Tuple[str, str]]
@@ -755,37 +758,42 @@ class ResultReporter:
               Summary: 1/2 succeeded
         """
         # Determine symbols based on unicode support
-        success_symbol = "✓" if _supports_unicode() else "+"
-        failure_symbol = "✗" if _supports_unicode() else "x"
-
-        # Print warning header with color
-        if _colors_enabled():
-            print(f"{Color.YELLOW.value}[WARNING]{Color.RESET.value} {summary}")
+        unicode = _supports_unicode()
+        success_symbol = "✓" if unicode else "+"
+        failure_symbol = "✗" if unicode else "x"
+        colors = _colors_enabled()
+
+        # Warning header with color
+        if colors:
+            lines = [f"{Color.YELLOW.value}[WARNING]{Color.RESET.value} {summary}"]
         else:
-            print(f"[WARNING] {summary}")
+            lines = [f"[WARNING] {summary}"]
 
-        # Print success items
+        # Success items
         for item in successes:
-            if _colors_enabled():
-                print(
+            if colors:
+                lines.append(
                     f"  {Color.GREEN.value}{success_symbol}{Color.RESET.value} {item}"
                 )
             else:
-                print(f"  {success_symbol} {item}")
+                lines.append(f"  {success_symbol} {item}")
 
-        # Print failure items
+        # Failure items
         for item, reason in failures:
-            if _colors_enabled():
-                print(
+            if colors:
+                lines.append(
                     f"  {Color.RED.value}{failure_symbol}{Color.RESET.value} {item}: {reason}"
                 )
             else:
-                print(f"  {failure_symbol} {item}: {reason}")
+                lines.append(f"  {failure_symbol} {item}: {reason}")
 
-        # Print summary line
+        # Summary line
         total = len(successes) + len(failures)
         succeeded = len(successes)
-        print(f"  Summary: {succeeded}/{total} succeeded")
+        lines.append(f"  Summary: {succeeded}/{total} succeeded")
+
+        # Emit the whole report in a single write
+        print("\n".join(lines))
 
 
 # =============================================================================
@@ -882,13 +890,44 @@ def format_warning(message: str, suggestion: str = None) -> None:
         [WARNING] Invalid header format 'foo'
           Suggestion: Expected KEY=VALUE
     """
+    print(_warning_text(message, suggestion))
+
+
+def format_warnings(warnings: List[Tuple[str, Optional[str]]]) -> None:
+    """Print several formatted warning messages in a single write.
+
+    Output is identical to calling format_warning() for each entry, but the
+    text is joined first so long result lists don't cost one write per line.
+
+    Args:
+        warnings: List of (message, suggestion) tuples; suggestion may be None
+    """
+    if warnings:
+        print(
+            "\n".join(
+                _warning_text(message, suggestion) for message, suggestion in warnings
+            )
+        )
+
+
+def _warning_text(message: str, suggestion: Optional[str] = None) -> str:
+    """Build the text printed by format_warning().
+
+    Args:
+        message: Warning message to display
+        suggestion: Optional suggestion for resolution
+
+    Returns:
+        Formatted warning, including the suggestion line if provided
+    """
     if _colors_enabled():
-        print(f"{Color.YELLOW.value}[WARNING]{Color.RESET.value} {message}")
+        text = f"{Color.YELLOW.value}[WARNING]{Color.RESET.value} {message}"
     else:
-        print(f"[WARNING] {message}")
+        text = f"[WARNING] {message}"
 
     if suggestion:
-        print(f"  Suggestion: {suggestion}")
+        text += f"\n  Suggestion: {suggestion}"
+    return text
 
 
 # =============================================================================
@@ -1176,6 +1215,11 @@ def parse_input(input_list: Optional[list]) -> Optional[list]:
     return parsed_inputs if parsed_inputs else None
 
 
+# Host name -> MCPHostType lookup for validating --host values without
+# going through the enum constructor and its ValueError path
+_MCP_HOST_BY_VALUE = {host_type.value: host_type for host_type in MCPHostType}
+
+
 def parse_host_list(host_arg: str) -> List[str]:
     """Parse comma-separated host list or 'all'.
 
@@ -1183,7 +1227,7 @@ def parse_host_list(host_arg: str) -> List[str]:
         host_arg: Comma-separated host names or 'all' for all available hosts
 
     Returns:
-        List[str]: List of host name strings
+        List[str]: List of unique host name strings, in the order given
 
     Raises:
         ValueError: If an unknown host name is provided
@@ -1198,14 +1242,13 @@ def parse_host_list(host_arg: str) -> List[str]:
     hosts = []
     for host_str in host_arg.split(","):
         host_str = host_str.strip()
-        try:
-            host_type = MCPHostType(host_str)
-            hosts.append(host_type.value)
-        except ValueError:
-            available = [h.value for h in MCPHostType]
+        if host_str not in _MCP_HOST_BY_VALUE:
+            available = list(_MCP_HOST_BY_VALUE)
             raise ValueError(f"Unknown host '{host_str}'. Available: {available}")
+        hosts.append(host_str)
 
-    return hosts
+    # Drop repeated hosts so each one is only configured once
+    return list(dict.fromkeys(hosts))
 
 
 def get_package_mcp_server_config(
@@ -9,7 +9,7 @@ import json
 import logging
 import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from hatch_validator.registry.registry_service import RegistryService
 from hatch.registry_retriever import RegistryRetriever
@@ -93,6 +93,11 @@ class HatchEnvironmentManager:
             registry_data=self.registry_data,
         )
 
+        # Per-environment package name index, invalidated by a generation
+        # counter that is bumped whenever the environments cache changes
+        self._environments_generation = 0
+        self._package_index_cache: Dict[str, Tuple[int, Dict[str, Dict]]] = {}
+
         # Load environments into cache
         self._environments = self._load_environments()
         self._current_env_name = self._load_current_env_name()
@@ -167,10 +172,12 @@ class HatchEnvironmentManager:
         """Reload environments from disk."""
         self._environments = self._load_environments()
         self._current_env_name = self._load_current_env_name()
+        self._environments_generation += 1
         self.logger.info("Reloaded environments from disk")
 
     def _save_environments(self):
         """Save environments to the environments file."""
+        self._environments_generation += 1
         try:
             with open(self.environments_file, "w") as f:
                 json.dump(self._environments, f, indent=2)
@@ -200,6 +207,35 @@ class HatchEnvironmentManager:
         """
         return self._environments[env_name]
 
+    def get_environment_package_index(self, env_name: str) -> Dict[str, Dict]:
+        """Get a mapping of package name to package entry for an environment.
+
+        The index is cached per environment and rebuilt only after the
+        environments cache has been saved or reloaded, so repeated package
+        lookups within a command are O(1) instead of a scan of the package list.
+
+        Args:
+            env_name: Name of the environment
+
+        Returns:
+            Dict[str, Dict]: Package entries keyed by package name
+
+        Raises:
+            KeyError: If environment doesn't exist
+        """
+        cached = self._package_index_cache.get(env_name)
+        if cached is not None and cached[0] == self._environments_generation:
+            return cached[1]
+
+        # Entries without a name cannot be looked up and are left out
+        index = {
+            name: pkg
+            for pkg in self._environments[env_name].get("packages", [])
+            if (name := pkg.get("name")) is not None
+        }
+        self._package_index_cache[env_name] = (self._environments_generation, index)
+        return index
+
     def set_current_environment(self, env_name: str) -> bool:
         """
         Set the current environment.
@@ -768,8 +804,66 @@ class HatchEnvironmentManager:
             self.logger.error(f"Failed to update package host configuration: {e}")
             return False
 
+    def batch_update_package_host_configurations(
+        self, env_name: str, updates: List[Tuple[str, str, dict]]
+    ) -> int:
+        """Update host configuration tracking for several packages at once.
+
+        Applies the same conflict cleanup and tracking update as
+        update_package_host_configuration() for each entry, but persists the
+        environments file once at the end instead of once per update. Updates
+        that succeeded are saved even if a later one fails.
+
+        Args:
+            env_name (str): Environment name
+            updates (List[Tuple[str, str, dict]]): (package_name, hostname,
+                server_config) tuples to apply
+
+        Returns:
+            int: Number of updates applied successfully
+        """
+        if env_name not in self._environments:
+            self.logger.error(f"Environment {env_name} does not exist")
+            return 0
+
+        updated = 0
+        modified = False
+        try:
+            for package_name, hostname, server_config in updates:
+                try:
+                    conflicts_removed = self._cleanup_package_host_conflicts(
+                        target_env=env_name,
+                        package_name=package_name,
+                        hostname=hostname,
+                        save=False,
+                    )
+                    modified = modified or conflicts_removed > 0
+
+                    if not self._update_target_environment_configuration(
+                        env_name, package_name, hostname, server_config, save=False
+                    ):
+                        continue
+
+                    updated += 1
+                    modified = True
+                    if conflicts_removed > 0:
+                        self.logger.warning(
+                            f"Package '{package_name}' host configuration for '{hostname}' "
+                            f"transferred from {conflicts_removed} other environment(s) to '{env_name}'"
+                        )
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to update package host configuration for "
+                        f"{package_name} on {hostname}: {e}"
+                    )
+        finally:
+            if modified:
+                self._save_environments()
+
+        return updated
+
     def _cleanup_package_host_conflicts(
-        self, target_env: str, package_name: str, hostname: str
+        self, target_env: str, package_name: str, hostname: str, save: bool = True
     ) -> int:
         """Remove conflicting package-host configurations from other environments.
 
@@ -781,6 +875,8 @@ class HatchEnvironmentManager:
             target_env (str): Environment that should control the configuration
             package_name (str): Package name
             hostname (str): Host identifier
+            save (bool): Whether to persist the environments file when
+                conflicts were removed. Defaults to True.
 
         Returns:
             int: Number of conflicting configurations removed
@@ -809,13 +905,18 @@ class HatchEnvironmentManager:
                             f"from environment '{env_name}'"
                         )
 
-        if conflicts_removed > 0:
+        if conflicts_removed > 0 and save:
             self._save_environments()
 
         return conflicts_removed
 
     def _update_target_environment_configuration(
-        self, env_name: str, package_name: str, hostname: str, server_config: dict
+        self,
+        env_name: str,
+        package_name: str,
+        hostname: str,
+        server_config: dict,
+        save: bool = True,
     ) -> bool:
         """Update the target environment's package host configuration.
 
@@ -827,6 +928,8 @@ class HatchEnvironmentManager:
             package_name (str): Package name
             hostname (str): Host identifier
             server_config (dict): Server configuration data
+            save (bool): Whether to persist the environments file after the
+                update. Defaults to True.
 
         Returns:
             bool: True if update successful, False otherwise
@@ -851,7 +954,8 @@ class HatchEnvironmentManager:
 
                 # Update the package in the environment
                 self._environments[env_name]["packages"][i] = pkg
-                self._save_environments()
+                if save:
+                    self._save_environments()
 
                 self.logger.info(
                     f"Updated host configuration for package {package_name} on {hostname}"
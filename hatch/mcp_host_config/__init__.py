@@ -34,6 +34,7 @@ from .reporting import (
     display_report,
 )
 from .adapters import AdapterRegistry, get_adapter, get_default_registry
+from .adapters.base import current_host
 
 # Import strategies to trigger decorator registration
 from . import strategies  # noqa: F401
@@ -53,6 +54,7 @@ __all__ = [
     "AdapterRegistry",
     "get_adapter",
     "get_default_registry",
+    "current_host",
     # User feedback reporting
     "FieldOperation",
     "ConversionReport",
@@ -4,22 +4,42 @@ This module provides host-specific adapters for the Unified Adapter Architecture
 Each adapter handles validation and serialization for a specific MCP host.
 """
 
-from hatch.mcp_host_config.adapters.augment import AugmentAdapter
+import importlib
+
 from hatch.mcp_host_config.adapters.base import AdapterValidationError, BaseAdapter
-from hatch.mcp_host_config.adapters.claude import ClaudeAdapter
-from hatch.mcp_host_config.adapters.codex import CodexAdapter
-from hatch.mcp_host_config.adapters.cursor import CursorAdapter
-from hatch.mcp_host_config.adapters.gemini import GeminiAdapter
-from hatch.mcp_host_config.adapters.kiro import KiroAdapter
-from hatch.mcp_host_config.adapters.lmstudio import LMStudioAdapter
-from hatch.mcp_host_config.adapters.mistral_vibe import MistralVibeAdapter
-from hatch.mcp_host_config.adapters.opencode import OpenCodeAdapter
 from hatch.mcp_host_config.adapters.registry import (
     AdapterRegistry,
     get_adapter,
     get_default_registry,
 )
-from hatch.mcp_host_config.adapters.vscode import VSCodeAdapter
+
+# Host-specific adapter classes are imported on first access (PEP 562), so
+# importing the package does not load every adapter module.
+_LAZY_ADAPTERS = {
+    "AugmentAdapter": "hatch.mcp_host_config.adapters.augment",
+    "ClaudeAdapter": "hatch.mcp_host_config.adapters.claude",
+    "CodexAdapter": "hatch.mcp_host_config.adapters.codex",
+    "CursorAdapter": "hatch.mcp_host_config.adapters.cursor",
+    "GeminiAdapter": "hatch.mcp_host_config.adapters.gemini",
+    "KiroAdapter": "hatch.mcp_host_config.adapters.kiro",
+    "LMStudioAdapter": "hatch.mcp_host_config.adapters.lmstudio",
+    "MistralVibeAdapter": "hatch.mcp_host_config.adapters.mistral_vibe",
+    "OpenCodeAdapter": "hatch.mcp_host_config.adapters.opencode",
+    "VSCodeAdapter": "hatch.mcp_host_config.adapters.vscode",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ADAPTERS:
+        adapter_class = getattr(importlib.import_module(_LAZY_ADAPTERS[name]), name)
+        globals()[name] = adapter_class
+        return adapter_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ADAPTERS))
+
 
 __all__ = [
     # Base classes and exceptions
@@ -16,10 +16,92 @@ Migration Note (v0.8.0):
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, FrozenSet, Optional
+from contextvars import ContextVar
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
 
 from hatch.mcp_host_config.models import MCPServerConfig
-from hatch.mcp_host_config.fields import EXCLUDED_ALWAYS
+from hatch.mcp_host_config.fields import EXCLUDED_ALWAYS, UNIVERSAL_FIELDS
+
+# Host currently being configured by this task. Set per host by parallel
+# operations (e.g. sync) so errors raised without an explicit host name are
+# still attributed to the right host.
+current_host: ContextVar[str] = ContextVar("current_host")
+
+# Fields a config may set while still filtering to the same view for every
+# host that supports all universal fields
+_UNIVERSAL_CONFIG_FIELDS = UNIVERSAL_FIELDS | {"name"}
+
+
+# Single-transport rule (command XOR url) as a lookup table indexed by
+# (has_command << 1) | has_url; None means the combination is valid.
+_SINGLE_TRANSPORT_ERRORS: Tuple[Optional[str], ...] = (
+    "Either 'command' (local) or 'url' (remote) must be specified",
+    None,
+    None,
+    "Cannot specify both 'command' and 'url' - choose one transport",
+)
+
+# Transport field required by each 'type' value, with the error raised when
+# it is missing
+_TYPE_TRANSPORT_FIELDS: Mapping[str, Tuple[str, str]] = {
+    "stdio": ("command", "type='stdio' requires 'command' field"),
+    "sse": ("url", "type='sse' requires 'url' field"),
+    "http": ("url", "type='http' requires 'url' field"),
+}
+
+
+def _detached(value: Any) -> Any:
+    """Copy the lists and dicts nested in a JSON value.
+
+    Scalars are immutable and returned as-is, so this is a cheaper deep copy
+    for the plain JSON values a config holds.
+    """
+    if isinstance(value, dict):
+        return {key: _detached(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_detached(item) for item in value]
+    return value
+
+
+def _copied(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached field dict so callers may modify any part of it."""
+    return {field: _detached(value) for field, value in values.items()}
+
+
+def _dumped(config: MCPServerConfig) -> Dict[str, Any]:
+    """Return the non-None fields of a config, cached on the config.
+
+    Equivalent to ``config.model_dump(exclude_none=True)`` for MCPServerConfig,
+    whose fields (and extra fields read from host files) are plain JSON
+    values, but read straight from the model's storage instead of running the
+    Pydantic serializer. The same config is typically serialized for several
+    hosts in a row (e.g. during sync), so the result is reused until a field
+    of the config is reassigned. Nested lists and dicts are copied so the
+    cache does not share them with the config; callers must still treat the
+    result as read-only, since it is the cache itself.
+
+    Args:
+        config: The MCPServerConfig to dump
+
+    Returns:
+        Dictionary of all non-None fields of the config
+    """
+    dumped = config._dump_cache
+    if dumped is None:
+        dumped = {
+            field: _detached(value)
+            for field, value in config.__dict__.items()
+            if value is not None
+        }
+        extra = config.__pydantic_extra__
+        if extra:
+            dumped.update(
+                (field, _detached(value))
+                for field, value in extra.items()
+                if value is not None
+            )
+        config._dump_cache = dumped
+    return dumped
 
 
 class AdapterValidationError(Exception):
@@ -28,7 +110,8 @@ class AdapterValidationError(Exception):
     Attributes:
         message: Human-readable error message
         field: The field that caused the error (if applicable)
-        host_name: The host adapter that raised the error
+        host_name: The host adapter that raised the error; defaults to
+            current_host when set
     """
 
     def __init__(
@@ -36,18 +119,14 @@ class AdapterValidationError(Exception):
     ):
         self.message = message
         self.field = field
-        self.host_name = host_name
+        self.host_name = host_name if host_name is not None else current_host.get(None)
         super().__init__(self._format_message())
 
     def _format_message(self) -> str:
         """Format the error message with optional context."""
-        parts = []
-        if self.host_name:
-            parts.append(f"[{self.host_name}]")
-        if self.field:
-            parts.append(f"Field '{self.field}':")
-        parts.append(self.message)
-        return " ".join(parts)
+        host_prefix = f"[{self.host_name}] " if self.host_name else ""
+        field_prefix = f"Field '{self.field}': " if self.field else ""
+        return f"{host_prefix}{field_prefix}{self.message}"
 
 
 class BaseAdapter(ABC):
@@ -75,43 +154,54 @@ class BaseAdapter(ABC):
         preventing false rejections during cross-host sync operations.
 
     Subclasses must implement:
-        - host_name: The identifier for this host
-        - get_supported_fields(): Fields this host accepts
-        - validate_filtered(): Host-specific validation logic (NEW PATTERN)
-        - serialize(): Convert config to host format
+        - host_name: The identifier for this host, normally a plain class
+          attribute (or an instance attribute set in __init__)
+        - SUPPORTED_FIELDS: Fields this host accepts (or override
+          get_supported_fields())
 
     Subclasses may override:
+        - validate_filtered(): Host-specific validation logic (default:
+          exactly one of command/url, and 'type' consistent with it)
         - apply_transformations(): Field name/value transformations (default: no-op)
-        - get_excluded_fields(): Additional fields to exclude (default: EXCLUDED_ALWAYS)
+        - EXCLUDED_FIELDS: Fields to exclude (default: EXCLUDED_ALWAYS)
+        - FIELD_MAPPINGS: Field renames applied by apply_transformations()
+          (default: none)
+        - serialize(): Only when the host needs more than
+          filter → validate → transform (default: that pipeline)
 
     Deprecated methods:
-        - validate(): Old validation pattern, will be removed in v0.9.0
-          Use validate_filtered() instead
+        - validate(): Old validation pattern, will be removed in v0.9.0.
+          Delegates to validate_filtered(); do not override.
 
-    Example (new pattern):
+    Example:
         >>> class ClaudeAdapter(BaseAdapter):
-        ...     @property
-        ...     def host_name(self) -> str:
-        ...         return "claude-desktop"
-        ...
-        ...     def get_supported_fields(self) -> FrozenSet[str]:
-        ...         return frozenset({"command", "args", "env", "url", "headers", "type"})
-        ...
-        ...     def validate_filtered(self, filtered: Dict[str, Any]) -> None:
-        ...         # Only validate fields that survived filtering
-        ...         has_command = 'command' in filtered
-        ...         has_url = 'url' in filtered
-        ...         if has_command and has_url:
-        ...             raise AdapterValidationError("Cannot have both command and url")
-        ...         if not has_command and not has_url:
-        ...             raise AdapterValidationError("Must have either command or url")
-        ...
-        ...     def serialize(self, config: MCPServerConfig) -> Dict[str, Any]:
-        ...         filtered = self.filter_fields(config)
-        ...         self.validate_filtered(filtered)
-        ...         return filtered  # No transformations needed for Claude
+        ...     host_name = "claude-desktop"
+        ...     SUPPORTED_FIELDS = frozenset(
+        ...         {"command", "args", "env", "url", "headers", "type"}
+        ...     )
     """
 
+    # Adapters are long-lived singletons; subclasses declare their own
+    # (possibly empty) __slots__ so instances carry no __dict__.
+    __slots__ = ("_allowed",)
+
+    # Field sets are constant per host, so they are declared as class
+    # attributes rather than computed by a method call
+    SUPPORTED_FIELDS: FrozenSet[str]
+    EXCLUDED_FIELDS: FrozenSet[str] = EXCLUDED_ALWAYS
+    # Universal field name → host-native field name, applied after validation
+    FIELD_MAPPINGS: Mapping[str, str] = {}
+    # Host-native field name → universal field renamed to it, derived from
+    # FIELD_MAPPINGS when a subclass is defined
+    _MAPPING_SOURCES: Mapping[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._MAPPING_SOURCES = {
+            host_field: universal_field
+            for universal_field, host_field in cls.FIELD_MAPPINGS.items()
+        }
+
     @property
     @abstractmethod
     def host_name(self) -> str:
@@ -122,22 +212,21 @@ class BaseAdapter(ABC):
         """
         ...
 
-    @abstractmethod
-    def get_supported_fields(self) -> FrozenSet[str]:
+    @classmethod
+    def get_supported_fields(cls) -> FrozenSet[str]:
         """Return the set of fields supported by this host.
 
         Returns:
-            FrozenSet of field names that this host accepts.
+            FrozenSet of field names that this host accepts (SUPPORTED_FIELDS).
             Fields not in this set will be filtered during serialization.
         """
-        ...
+        return cls.SUPPORTED_FIELDS
 
-    @abstractmethod
     def validate(self, config: MCPServerConfig) -> None:
         """Validate the configuration for this host.
 
-        This method should check host-specific rules and raise
-        AdapterValidationError if the configuration is invalid.
+        DEPRECATED: This method is deprecated and will be removed in v0.9.0.
+        Use validate_filtered() instead, which serialize() already calls.
 
         Args:
             config: The MCPServerConfig to validate
@@ -145,15 +234,19 @@ class BaseAdapter(ABC):
         Raises:
             AdapterValidationError: If validation fails
         """
-        ...
+        self.validate_filtered(self.filter_fields(config))
 
-    @abstractmethod
     def validate_filtered(self, filtered: Dict[str, Any]) -> None:
         """Validate ONLY the fields that survived filtering.
 
         This method validates logical constraints on filtered fields.
         It should NOT check for unsupported fields (already filtered out).
 
+        The default implementation enforces the rules shared by most hosts:
+        exactly one transport (command XOR url), and a 'type' discriminator,
+        if the host supports one, that matches that transport. Hosts with
+        different transport rules (e.g. Gemini's httpUrl) override it.
+
         Validation responsibilities:
         - Transport mutual exclusion (command XOR url, or host-specific rules)
         - Type consistency (e.g., type='stdio' requires command)
@@ -180,19 +273,54 @@ class BaseAdapter(ABC):
             ...     if not has_command and not has_url:
             ...         raise AdapterValidationError("Must have either command or url")
         """
-        ...
+        self._validate_single_transport(filtered)
+        self._validate_type_transport(filtered)
+
+    def _validate_single_transport(self, filtered: Dict[str, Any]) -> None:
+        """Require exactly one of 'command' (local) or 'url' (remote).
+
+        Shared by hosts that do not allow several transports at once.
+
+        Args:
+            filtered: Dictionary of filtered fields
+
+        Raises:
+            AdapterValidationError: If neither or both transports are set
+        """
+        error = _SINGLE_TRANSPORT_ERRORS[
+            ("command" in filtered) << 1 | ("url" in filtered)
+        ]
+        if error is not None:
+            raise AdapterValidationError(error, host_name=self.host_name)
+
+    def _validate_type_transport(self, filtered: Dict[str, Any]) -> None:
+        """Check that a 'type' discriminator matches the configured transport.
+
+        Args:
+            filtered: Dictionary of filtered fields
+
+        Raises:
+            AdapterValidationError: If 'type' names a transport whose field
+                is not set
+        """
+        rule = _TYPE_TRANSPORT_FIELDS.get(filtered.get("type"))
+        if rule is not None and rule[0] not in filtered:
+            raise AdapterValidationError(
+                rule[1], field="type", host_name=self.host_name
+            )
 
     def apply_transformations(self, filtered: Dict[str, Any]) -> Dict[str, Any]:
         """Apply host-specific field transformations.
 
         This hook method allows adapters to transform field names or values
-        after filtering and validation. The default implementation is a no-op
-        (returns filtered unchanged).
-
-        Override this method for hosts that require field mappings, such as:
+        after filtering and validation. The default implementation renames
+        fields according to FIELD_MAPPINGS and returns filtered unchanged when
+        the host declares no mappings, such as:
         - Codex: args → arguments, headers → http_headers
         - Cross-host sync: includeTools → enabled_tools (Gemini to Codex)
 
+        Override this method for transformations that are not plain renames.
+
         Args:
             filtered: Dictionary of validated, filtered fields
 
@@ -201,44 +329,92 @@ class BaseAdapter(ABC):
 
         Example:
             >>> def apply_transformations(self, filtered: Dict[str, Any]) -> Dict[str, Any]:
-            ...     result = filtered.copy()
-            ...     if 'args' in result:
-            ...         result['arguments'] = result.pop('args')
+            ...     result = super().apply_transformations(filtered)
+            ...     if 'url' in result:
+            ...         result = {**result, 'type': 'http'}
             ...     return result
         """
-        return filtered
+        mappings = self.FIELD_MAPPINGS
+        if not mappings:
+            return filtered
+
+        # Rename in a single pass. A field already named like a mapping
+        # target is dropped when the universal field mapped to it is also
+        # present, so the renamed universal value takes precedence.
+        sources = self._MAPPING_SOURCES
+        return {
+            mappings.get(field, field): value
+            for field, value in filtered.items()
+            if field not in sources or sources[field] not in filtered
+        }
 
-    @abstractmethod
     def serialize(self, config: MCPServerConfig) -> Dict[str, Any]:
         """Serialize the configuration for this host.
 
-        This method should convert the MCPServerConfig to the format
-        expected by the host's configuration file.
+        Converts the MCPServerConfig to the format expected by the host's
+        configuration file following the validate-after-filter pattern:
 
-        Standard implementation pattern:
             1. Filter fields: filtered = self.filter_fields(config)
             2. Validate filtered: self.validate_filtered(filtered)
             3. Transform fields: transformed = self.apply_transformations(filtered)
             4. Return transformed
 
+        Subclasses normally customize validate_filtered() and
+        apply_transformations() rather than overriding this method.
+
         Args:
             config: The MCPServerConfig to serialize
 
         Returns:
             Dictionary in the host's expected format
+
+        Raises:
+            AdapterValidationError: If validation fails
         """
-        ...
+        filtered = self.filter_fields(config)
+        self.validate_filtered(filtered)
+        return self.apply_transformations(filtered)
+
+    def serialize_many(
+        self, configs: Mapping[str, MCPServerConfig]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Serialize several named configurations for this host.
+
+        Used by strategies when writing a whole host configuration file.
+
+        Args:
+            configs: Mapping of server name to MCPServerConfig
+
+        Returns:
+            Mapping of server name to serialized configuration, in the same
+            order as configs
 
-    def get_excluded_fields(self) -> FrozenSet[str]:
+        Raises:
+            AdapterValidationError: If any configuration fails validation
+        """
+        serialize = self.serialize
+        return {name: serialize(config) for name, config in configs.items()}
+
+    @classmethod
+    def get_excluded_fields(cls) -> FrozenSet[str]:
         """Return fields that should always be excluded from serialization.
 
         By default, returns EXCLUDED_ALWAYS (e.g., 'name' which is Hatch metadata).
-        Subclasses can override to add host-specific exclusions.
+        Subclasses can set EXCLUDED_FIELDS to add host-specific exclusions.
 
         Returns:
-            FrozenSet of field names to exclude
+            FrozenSet of field names to exclude (EXCLUDED_FIELDS)
         """
-        return EXCLUDED_ALWAYS
+        return cls.EXCLUDED_FIELDS
+
+    @property
+    def _allowed_fields(self) -> FrozenSet[str]:
+        """Supported fields minus excluded fields, computed once per adapter."""
+        try:
+            return self._allowed
+        except AttributeError:
+            self._allowed = self.get_supported_fields() - self.get_excluded_fields()
+            return self._allowed
 
     def filter_fields(self, config: MCPServerConfig) -> Dict[str, Any]:
         """Filter config to only include supported, non-excluded, non-None fields.
@@ -255,12 +431,35 @@ class BaseAdapter(ABC):
         Returns:
             Dictionary with only valid fields for this host
         """
-        supported = self.get_supported_fields()
-        excluded = self.get_excluded_fields()
-
-        result = {}
-        for field, value in config.model_dump(exclude_none=True).items():
-            if field in supported and field not in excluded:
-                result[field] = value
-
-        return result
+        allowed = self._allowed_fields
+        filter_cache = config._filter_cache
+        if filter_cache is None:
+            filter_cache = config._filter_cache = {}
+
+        # Adapters sharing a field set (e.g. both Claude variants) reuse the
+        # same filtered view; callers get a copy, nested values included,
+        # that they are free to modify.
+        filtered = filter_cache.get(allowed)
+        if filtered is None:
+            dumped = _dumped(config)
+            if (
+                dumped.keys() <= _UNIVERSAL_CONFIG_FIELDS
+                and UNIVERSAL_FIELDS <= allowed
+                and "name" not in allowed
+            ):
+                # Fast path for configs setting only universal fields (the
+                # common command/args/env case): every host supporting those
+                # fields gets the same view, so it is built once per config.
+                filtered = filter_cache.get(UNIVERSAL_FIELDS)
+                if filtered is None:
+                    filtered = filter_cache[UNIVERSAL_FIELDS] = {
+                        field: value
+                        for field, value in dumped.items()
+                        if field != "name"
+                    }
+            else:
+                filtered = {
+                    field: value for field, value in dumped.items() if field in allowed
+                }
+            filter_cache[allowed] = filtered
+        return _copied(filtered)
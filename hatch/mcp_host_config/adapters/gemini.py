@@ -8,11 +8,30 @@ Gemini has unique features:
 - Working directory, timeout, trust settings
 """
 
-from typing import Any, Dict, FrozenSet
+from typing import Any, Dict, Optional, Tuple
 
 from hatch.mcp_host_config.adapters.base import AdapterValidationError, BaseAdapter
 from hatch.mcp_host_config.fields import GEMINI_FIELDS
-from hatch.mcp_host_config.models import MCPServerConfig
+
+_NO_TRANSPORT = (
+    "At least one transport must be specified: 'command', 'url', or 'httpUrl'"
+)
+_MULTIPLE_TRANSPORTS = (
+    "Only one transport allowed: command, url, or httpUrl (not multiple)"
+)
+
+# Exactly-one-transport rule as a lookup table indexed by
+# (has_command << 2) | (has_url << 1) | has_http_url
+_TRANSPORT_ERRORS: Tuple[Optional[str], ...] = (
+    _NO_TRANSPORT,
+    None,
+    None,
+    _MULTIPLE_TRANSPORTS,
+    None,
+    _MULTIPLE_TRANSPORTS,
+    _MULTIPLE_TRANSPORTS,
+    _MULTIPLE_TRANSPORTS,
+)
 
 
 class GeminiAdapter(BaseAdapter):
@@ -25,42 +44,9 @@ class GeminiAdapter(BaseAdapter):
     - Has rich configuration: OAuth, timeout, trust, tool filtering
     """
 
-    @property
-    def host_name(self) -> str:
-        """Return the host identifier."""
-        return "gemini"
-
-    def get_supported_fields(self) -> FrozenSet[str]:
-        """Return fields supported by Gemini."""
-        return GEMINI_FIELDS
-
-    def validate(self, config: MCPServerConfig) -> None:
-        """Validate configuration for Gemini.
-
-        DEPRECATED: This method is deprecated and will be removed in v0.9.0.
-        Use validate_filtered() instead.
-
-        Gemini requires exactly one transport (command, url, or httpUrl).
-        """
-        has_command = config.command is not None
-        has_url = config.url is not None
-        has_http_url = config.httpUrl is not None
-
-        # Must have exactly one transport (mutual exclusion)
-        # Count how many transports are present
-        transport_count = sum([has_command, has_url, has_http_url])
-
-        if transport_count == 0:
-            raise AdapterValidationError(
-                "At least one transport must be specified: 'command', 'url', or 'httpUrl'",
-                host_name=self.host_name,
-            )
-
-        if transport_count > 1:
-            raise AdapterValidationError(
-                "Only one transport allowed: command, url, or httpUrl (not multiple)",
-                host_name=self.host_name,
-            )
+    __slots__ = ()
+    host_name = "gemini"
+    SUPPORTED_FIELDS = GEMINI_FIELDS
 
     def validate_filtered(self, filtered: Dict[str, Any]) -> None:
         """Validate filtered configuration for Gemini.
@@ -76,38 +62,10 @@ class GeminiAdapter(BaseAdapter):
         Raises:
             AdapterValidationError: If validation fails
         """
-        has_command = "command" in filtered
-        has_url = "url" in filtered
-        has_http_url = "httpUrl" in filtered
-
-        # Must have exactly one transport (mutual exclusion)
-        transport_count = sum([has_command, has_url, has_http_url])
-
-        if transport_count == 0:
-            raise AdapterValidationError(
-                "At least one transport must be specified: 'command', 'url', or 'httpUrl'",
-                host_name=self.host_name,
-            )
-
-        if transport_count > 1:
-            raise AdapterValidationError(
-                "Only one transport allowed: command, url, or httpUrl (not multiple)",
-                host_name=self.host_name,
-            )
-
-    def serialize(self, config: MCPServerConfig) -> Dict[str, Any]:
-        """Serialize configuration for Gemini format.
-
-        Follows the validate-after-filter pattern:
-        1. Filter to supported fields
-        2. Validate filtered fields
-        3. Return filtered (no transformations needed)
-        """
-        # Filter to supported fields
-        filtered = self.filter_fields(config)
-
-        # Validate filtered fields
-        self.validate_filtered(filtered)
-
-        # Return filtered (no transformations needed for Gemini)
-        return filtered
+        error = _TRANSPORT_ERRORS[
+            ("command" in filtered) << 2
+            | ("url" in filtered) << 1
+            | ("httpUrl" in filtered)
+        ]
+        if error is not None:
+            raise AdapterValidationError(error, host_name=self.host_name)
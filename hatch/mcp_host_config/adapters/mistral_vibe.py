@@ -4,59 +4,79 @@ Mistral Vibe uses TOML `[[mcp_servers]]` entries with an explicit `transport`
 field instead of the Claude-style `type` discriminator.
 """
 
-from typing import Any, Dict, FrozenSet
+from typing import Any, Dict, Optional, Tuple
 
 from hatch.mcp_host_config.adapters.base import AdapterValidationError, BaseAdapter
 from hatch.mcp_host_config.fields import MISTRAL_VIBE_FIELDS
 from hatch.mcp_host_config.models import MCPServerConfig
 
+# Single-transport rule as a lookup table indexed by
+# (has_command << 1) | has_url; None means the combination is valid.
+_SINGLE_TRANSPORT_ERRORS: Tuple[Optional[str], ...] = (
+    "Either 'command' or 'url' must be specified",
+    None,
+    None,
+    "Cannot specify multiple transports - choose exactly one of 'command' or 'url'",
+)
+
+# Transport field required by each 'transport' value, with the error raised
+# when it is missing
+_TRANSPORT_FIELDS = {
+    "stdio": ("command", "transport='stdio' requires 'command' field"),
+    "http": ("url", "transport='http' requires 'url' field"),
+    "streamable-http": ("url", "transport='streamable-http' requires 'url' field"),
+}
+
 
 class MistralVibeAdapter(BaseAdapter):
     """Adapter for Mistral Vibe MCP server configuration."""
 
-    @property
-    def host_name(self) -> str:
-        """Return the host identifier."""
-        return "mistral-vibe"
+    __slots__ = ()
+    host_name = "mistral-vibe"
+    SUPPORTED_FIELDS = MISTRAL_VIBE_FIELDS
 
-    def get_supported_fields(self) -> FrozenSet[str]:
-        """Return fields supported by Mistral Vibe."""
-        return MISTRAL_VIBE_FIELDS
+    def filter_fields(self, config: MCPServerConfig) -> Dict[str, Any]:
+        """Filter configuration for Mistral Vibe, deriving its transport fields.
 
-    def validate(self, config: MCPServerConfig) -> None:
-        """Deprecated compatibility wrapper for legacy adapter tests."""
-        self.validate_filtered(self.filter_fields(config))
+        Cross-host sync hints (httpUrl, type) are not native Vibe fields, so
+        they are filtered out, but they still decide the url and transport of
+        the filtered result. Keeping this here lets the inherited serialize()
+        pipeline handle Vibe like every other host, starting from the filtered
+        view shared with other adapters.
 
-    def validate_filtered(self, filtered: Dict[str, Any]) -> None:
-        """Validate Mistral Vibe transport rules on filtered fields."""
-        has_command = "command" in filtered
-        has_url = "url" in filtered
-        transport_count = sum([has_command, has_url])
+        Args:
+            config: The MCPServerConfig to filter
 
-        if transport_count == 0:
-            raise AdapterValidationError(
-                "Either 'command' or 'url' must be specified",
-                host_name=self.host_name,
-            )
+        Returns:
+            Dictionary with only valid fields for Mistral Vibe
+        """
+        filtered = super().filter_fields(config)
 
-        if transport_count > 1:
-            raise AdapterValidationError(
-                "Cannot specify multiple transports - choose exactly one of 'command' or 'url'",
-                host_name=self.host_name,
-            )
+        if (
+            "command" not in filtered
+            and "url" not in filtered
+            and config.httpUrl is not None
+        ):
+            filtered["url"] = config.httpUrl
 
-        transport = filtered.get("transport")
-        if transport == "stdio" and not has_command:
-            raise AdapterValidationError(
-                "transport='stdio' requires 'command' field",
-                field="transport",
-                host_name=self.host_name,
-            )
-        if transport in ("http", "streamable-http") and not has_url:
+        transport_hint = self._infer_transport(filtered, config=config)
+        if transport_hint is not None:
+            filtered["transport"] = transport_hint
+
+        return filtered
+
+    def validate_filtered(self, filtered: Dict[str, Any]) -> None:
+        """Validate Mistral Vibe transport rules on filtered fields."""
+        error = _SINGLE_TRANSPORT_ERRORS[
+            ("command" in filtered) << 1 | ("url" in filtered)
+        ]
+        if error is not None:
+            raise AdapterValidationError(error, host_name=self.host_name)
+
+        rule = _TRANSPORT_FIELDS.get(filtered.get("transport"))
+        if rule is not None and rule[0] not in filtered:
             raise AdapterValidationError(
-                f"transport='{transport}' requires 'url' field",
-                field="transport",
-                host_name=self.host_name,
+                rule[1], field="transport", host_name=self.host_name
             )
 
     def apply_transformations(
@@ -72,25 +92,6 @@ class MistralVibeAdapter(BaseAdapter):
 
         return result
 
-    def serialize(self, config: MCPServerConfig) -> Dict[str, Any]:
-        """Serialize configuration for Mistral Vibe format."""
-        filtered = self.filter_fields(config)
-
-        # Support cross-host sync hints without advertising these as native fields.
-        if (
-            "command" not in filtered
-            and "url" not in filtered
-            and config.httpUrl is not None
-        ):
-            filtered["url"] = config.httpUrl
-
-        transport_hint = self._infer_transport(filtered, config=config)
-        if transport_hint is not None:
-            filtered["transport"] = transport_hint
-
-        self.validate_filtered(filtered)
-        return self.apply_transformations(filtered)
-
     def _infer_transport(
         self, filtered: Dict[str, Any], config: MCPServerConfig | None = None
     ) -> str | None:
@@ -4,26 +4,64 @@ This module provides a centralized registry for host-specific adapters.
 The registry maps host names to adapter instances and provides factory methods.
 """
 
-from typing import Dict, List, Optional
+import importlib
+import threading
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from hatch.mcp_host_config.adapters.augment import AugmentAdapter
 from hatch.mcp_host_config.adapters.base import BaseAdapter
-from hatch.mcp_host_config.adapters.claude import ClaudeAdapter
-from hatch.mcp_host_config.adapters.codex import CodexAdapter
-from hatch.mcp_host_config.adapters.cursor import CursorAdapter
-from hatch.mcp_host_config.adapters.gemini import GeminiAdapter
-from hatch.mcp_host_config.adapters.kiro import KiroAdapter
-from hatch.mcp_host_config.adapters.lmstudio import LMStudioAdapter
-from hatch.mcp_host_config.adapters.mistral_vibe import MistralVibeAdapter
-from hatch.mcp_host_config.adapters.opencode import OpenCodeAdapter
-from hatch.mcp_host_config.adapters.vscode import VSCodeAdapter
+
+# Built-in adapters as host name -> (module, class name, constructor kwargs)
+_DEFAULT_ADAPTERS: Dict[str, Tuple[str, str, Dict[str, Any]]] = {
+    "claude-desktop": (
+        "hatch.mcp_host_config.adapters.claude",
+        "ClaudeAdapter",
+        {"variant": "desktop"},
+    ),
+    "claude-code": (
+        "hatch.mcp_host_config.adapters.claude",
+        "ClaudeAdapter",
+        {"variant": "code"},
+    ),
+    "vscode": ("hatch.mcp_host_config.adapters.vscode", "VSCodeAdapter", {}),
+    "cursor": ("hatch.mcp_host_config.adapters.cursor", "CursorAdapter", {}),
+    "lmstudio": ("hatch.mcp_host_config.adapters.lmstudio", "LMStudioAdapter", {}),
+    "gemini": ("hatch.mcp_host_config.adapters.gemini", "GeminiAdapter", {}),
+    "kiro": ("hatch.mcp_host_config.adapters.kiro", "KiroAdapter", {}),
+    "codex": ("hatch.mcp_host_config.adapters.codex", "CodexAdapter", {}),
+    "mistral-vibe": (
+        "hatch.mcp_host_config.adapters.mistral_vibe",
+        "MistralVibeAdapter",
+        {},
+    ),
+    "opencode": ("hatch.mcp_host_config.adapters.opencode", "OpenCodeAdapter", {}),
+    "augment": ("hatch.mcp_host_config.adapters.augment", "AugmentAdapter", {}),
+}
+
+
+def _create_adapter(
+    module_name: str, class_name: str, kwargs: Dict[str, Any]
+) -> BaseAdapter:
+    """Import a built-in adapter class and instantiate it.
+
+    Args:
+        module_name: Module defining the adapter class
+        class_name: Name of the adapter class
+        kwargs: Constructor keyword arguments
+
+    Returns:
+        The new adapter instance
+    """
+    adapter_class = getattr(importlib.import_module(module_name), class_name)
+    return adapter_class(**kwargs)
 
 
 class AdapterRegistry:
     """Registry for MCP host configuration adapters.
 
     The registry provides:
-    - Host name to adapter mapping
+    - Host name to adapter mapping (built-in adapters are created on first
+      lookup)
     - Factory method to get adapters by host name
     - Registration of custom adapters
     - List of all supported hosts
@@ -38,27 +76,31 @@ class AdapterRegistry:
         ['augment', 'claude-code', 'claude-desktop', 'codex', 'cursor', 'gemini', 'kiro', 'lmstudio', 'mistral-vibe', 'opencode', 'vscode']
     """
 
+    __slots__ = ("_adapters", "_factories", "_sorted_hosts", "_lock")
+
     def __init__(self):
         """Initialize the registry with default adapters."""
         self._adapters: Dict[str, BaseAdapter] = {}
+        # Built-in adapters not instantiated yet, by host name
+        self._factories: Dict[str, Callable[[], BaseAdapter]] = {}
+        # Sorted host names, rebuilt after register()/unregister()
+        self._sorted_hosts: Optional[Tuple[str, ...]] = None
+        # Guards changes to the adapter tables; hosts may be configured from
+        # worker threads that create the same built-in adapter concurrently
+        self._lock = threading.Lock()
         self._register_defaults()
 
     def _register_defaults(self) -> None:
-        """Register all built-in adapters."""
-        # Claude variants
-        self.register(ClaudeAdapter(variant="desktop"))
-        self.register(ClaudeAdapter(variant="code"))
-
-        # Other hosts
-        self.register(VSCodeAdapter())
-        self.register(CursorAdapter())
-        self.register(LMStudioAdapter())
-        self.register(GeminiAdapter())
-        self.register(KiroAdapter())
-        self.register(CodexAdapter())
-        self.register(MistralVibeAdapter())
-        self.register(OpenCodeAdapter())
-        self.register(AugmentAdapter())
+        """Register all built-in adapters.
+
+        Built-in adapters are registered as factories: each adapter module is
+        only imported, and its adapter instantiated, the first time its host
+        is looked up, since a command usually touches one or two hosts.
+        """
+        for host_name, (module_name, class_name, kwargs) in _DEFAULT_ADAPTERS.items():
+            self._factories[host_name] = partial(
+                _create_adapter, module_name, class_name, kwargs
+            )
 
     def register(self, adapter: BaseAdapter) -> None:
         """Register an adapter instance.
@@ -70,9 +112,11 @@ class AdapterRegistry:
             ValueError: If an adapter with the same host name is already registered
         """
         host_name = adapter.host_name
-        if host_name in self._adapters:
-            raise ValueError(f"Adapter for '{host_name}' is already registered")
-        self._adapters[host_name] = adapter
+        with self._lock:
+            if self.has_adapter(host_name):
+                raise ValueError(f"Adapter for '{host_name}' is already registered")
+            self._adapters[host_name] = adapter
+            self._sorted_hosts = None
 
     def get_adapter(self, host_name: str) -> BaseAdapter:
         """Get an adapter by host name.
@@ -86,12 +130,28 @@ class AdapterRegistry:
         Raises:
             KeyError: If no adapter is registered for the host name
         """
-        if host_name not in self._adapters:
-            supported = ", ".join(sorted(self._adapters.keys()))
-            raise KeyError(
-                f"No adapter registered for '{host_name}'. Supported hosts: {supported}"
-            )
-        return self._adapters[host_name]
+        try:
+            return self._adapters[host_name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            # Another thread may have created the adapter while this one
+            # waited for the lock
+            adapter = self._adapters.get(host_name)
+            if adapter is not None:
+                return adapter
+
+            factory = self._factories.get(host_name)
+            if factory is None:
+                supported = ", ".join(self._get_sorted_hosts())
+                raise KeyError(
+                    f"No adapter registered for '{host_name}'. "
+                    f"Supported hosts: {supported}"
+                )
+            adapter = self._adapters[host_name] = factory()
+            self._factories.pop(host_name, None)
+            return adapter
 
     def has_adapter(self, host_name: str) -> bool:
         """Check if an adapter is registered for a host name.
@@ -102,7 +162,7 @@ class AdapterRegistry:
         Returns:
             True if an adapter is registered, False otherwise
         """
-        return host_name in self._adapters
+        return host_name in self._adapters or host_name in self._factories
 
     def get_supported_hosts(self) -> List[str]:
         """Get a sorted list of all supported host names.
@@ -110,7 +170,13 @@ class AdapterRegistry:
         Returns:
             Sorted list of host name strings
         """
-        return sorted(self._adapters.keys())
+        return list(self._get_sorted_hosts())
+
+    def _get_sorted_hosts(self) -> Tuple[str, ...]:
+        """Return registered host names in sorted order, sorting only once."""
+        if self._sorted_hosts is None:
+            self._sorted_hosts = tuple(sorted(self._adapters.keys() | self._factories))
+        return self._sorted_hosts
 
     def unregister(self, host_name: str) -> None:
         """Unregister an adapter by host name.
@@ -121,13 +187,19 @@ class AdapterRegistry:
         Raises:
             KeyError: If no adapter is registered for the host name
         """
-        if host_name not in self._adapters:
-            raise KeyError(f"No adapter registered for '{host_name}'")
-        del self._adapters[host_name]
+        with self._lock:
+            if host_name in self._adapters:
+                del self._adapters[host_name]
+            elif host_name in self._factories:
+                del self._factories[host_name]
+            else:
+                raise KeyError(f"No adapter registered for '{host_name}'")
+            self._sorted_hosts = None
 
 
 # Global registry instance for convenience
 _default_registry: Optional[AdapterRegistry] = None
+_default_registry_lock = threading.Lock()
 
 
 def get_default_registry() -> AdapterRegistry:
@@ -138,7 +210,9 @@ def get_default_registry() -> AdapterRegistry:
     """
     global _default_registry
     if _default_registry is None:
-        _default_registry = AdapterRegistry()
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = AdapterRegistry()
     return _default_registry
 
 
@@ -4,14 +4,16 @@ This module provides comprehensive backup and restore functionality for MCP
 host configuration files with atomic operations and Pydantic data validation.
 """
 
-import json
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable, TextIO
+from typing import Dict, List, Optional, Any, BinaryIO, Callable, TextIO, Union
 
 from pydantic import BaseModel, Field, validator
 
+from .json_io import dumps_json
+
 
 class BackupError(Exception):
     """Exception raised when backup operations fail."""
@@ -119,10 +121,11 @@ class AtomicFileOperations:
         self,
         file_path: Path,
         data: Any,
-        serializer: Callable[[Any, TextIO], None],
+        serializer: Callable[[Any, Union[TextIO, BinaryIO]], None],
         backup_manager: "MCPHostConfigBackupManager",
         hostname: str,
         skip_backup: bool = False,
+        binary: bool = False,
     ) -> bool:
         """Atomic write with custom serializer and automatic backup creation.
 
@@ -133,6 +136,8 @@ class AtomicFileOperations:
             backup_manager: Backup manager instance
             hostname: Host identifier for backup
             skip_backup: Skip backup creation
+            binary: Open the file in binary mode, for serializers that write
+                bytes; text serializers get a UTF-8 text file
 
         Returns:
             bool: True if operation successful
@@ -140,35 +145,54 @@ class AtomicFileOperations:
         Raises:
             BackupError: If backup creation fails and skip_backup is False
         """
+        # The new content is written to a temporary file first, so the
+        # original file is untouched until the final atomic replace. Because
+        # the original is replaced rather than rewritten, the backup can be a
+        # hard link to it instead of a copy.
+        temp_file = file_path.with_suffix(f"{file_path.suffix}.tmp")
+        try:
+            if binary:
+                with open(temp_file, "wb") as f:
+                    serializer(data, f)
+            else:
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    serializer(data, f)
+        except Exception as e:
+            if temp_file.exists():
+                temp_file.unlink()
+            raise BackupError(f"Atomic write failed: {str(e)}")
+
         # Create backup if file exists and backup not skipped
         backup_result = None
         if file_path.exists() and not skip_backup:
-            backup_result = backup_manager.create_backup(file_path, hostname)
+            backup_result = backup_manager.create_backup(file_path, hostname, link=True)
             if not backup_result.success:
+                temp_file.unlink()
                 raise BackupError(
                     f"Required backup failed: {backup_result.error_message}"
                 )
 
-        temp_file = None
         try:
-            temp_file = file_path.with_suffix(f"{file_path.suffix}.tmp")
-            with open(temp_file, "w", encoding="utf-8") as f:
-                serializer(data, f)
-
             temp_file.replace(file_path)
             return True
-
         except Exception as e:
-            if temp_file and temp_file.exists():
+            if temp_file.exists():
                 temp_file.unlink()
 
             if backup_result and backup_result.backup_path:
+                backup_path = backup_result.backup_path
                 try:
-                    backup_manager.restore_backup(
-                        hostname, backup_result.backup_path.name
-                    )
+                    backup_manager.restore_backup(hostname, backup_path.name)
                 except Exception:
                     pass
+                # A hard-linked backup of a file that was never replaced
+                # still shares its data; drop it so later in-place edits of
+                # the config cannot change the backup.
+                try:
+                    if file_path.exists() and os.path.samefile(backup_path, file_path):
+                        backup_path.unlink()
+                except OSError:
+                    pass
 
             raise BackupError(f"Atomic write failed: {str(e)}")
 
@@ -196,11 +220,18 @@ class AtomicFileOperations:
             BackupError: If backup creation fails and skip_backup is False
         """
 
-        def json_serializer(data: Any, f: TextIO) -> None:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        def json_serializer(data: Any, f: BinaryIO) -> None:
+            # dumps_json() already returns UTF-8 bytes
+            f.write(dumps_json(data))
 
         return self.atomic_write_with_serializer(
-            file_path, data, json_serializer, backup_manager, hostname, skip_backup
+            file_path,
+            data,
+            json_serializer,
+            backup_manager,
+            hostname,
+            skip_backup,
+            binary=True,
         )
 
     def atomic_copy(self, source: Path, target: Path) -> bool:
@@ -248,12 +279,19 @@ class MCPHostConfigBackupManager:
         self.backup_root.mkdir(parents=True, exist_ok=True)
         self.atomic_ops = AtomicFileOperations()
 
-    def create_backup(self, config_path: Path, hostname: str) -> BackupResult:
+    def create_backup(
+        self, config_path: Path, hostname: str, link: bool = False
+    ) -> BackupResult:
         """Create timestamped backup of host configuration.
 
         Args:
             config_path (Path): Path to original configuration file
             hostname (str): Host identifier (claude-desktop, claude-code, vscode, cursor, lmstudio, gemini)
+            link (bool, optional): Hard-link the backup to the original file
+                instead of copying it, falling back to a copy where links are
+                unsupported. Only safe when the caller immediately replaces
+                config_path with a new file (e.g. os.replace) rather than
+                writing to it in place. Defaults to False.
 
         Returns:
             BackupResult: Operation result with backup path or error message
@@ -286,8 +324,15 @@ class MCPHostConfigBackupManager:
             # Get original file size
             original_size = config_path.stat().st_size
 
-            # Atomic copy operation
-            if not self.atomic_ops.atomic_copy(config_path, backup_path):
+            # Hard link (no data copied) when requested, else atomic copy
+            linked = False
+            if link:
+                try:
+                    os.link(config_path, backup_path)
+                    linked = True
+                except OSError:
+                    pass
+            if not linked and not self.atomic_ops.atomic_copy(config_path, backup_path):
                 return BackupResult(
                     success=False, error_message="Atomic copy operation failed"
                 )
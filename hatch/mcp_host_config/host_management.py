@@ -6,10 +6,14 @@ decorator-based strategy registration following Hatchling patterns,
 host registry, and configuration manager with consolidated model support.
 """
 
-from typing import Dict, List, Type, Optional, Callable, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Dict, List, NamedTuple, Tuple, Type, Optional, Callable, Any
 from pathlib import Path
 import logging
 
+from pydantic import ValidationError
+
 from .models import (
     MCPHostType,
     MCPServerConfig,
@@ -18,9 +22,30 @@ from .models import (
     ConfigurationResult,
     SyncResult,
 )
+from .adapters import get_adapter
+from .adapters.base import current_host
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on target hosts synchronized concurrently
+_MAX_SYNC_WORKERS = 8
+
+
+def _call_for_host(host_name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Call func with current_host set to host_name in the running context."""
+    current_host.set(host_name)
+    return func(*args, **kwargs)
+
+
+class _PendingSync(NamedTuple):
+    """A resolved target host waiting to be written by sync_configurations()."""
+
+    index: int
+    host: str
+    host_type: MCPHostType
+    strategy: "MCPHostStrategy"
+    server_configs: Dict[str, MCPServerConfig]
+
 
 class MCPHostRegistry:
     """Registry for MCP host strategies with decorator-based registration."""
@@ -198,6 +223,114 @@ class MCPHostConfigurationManager:
                 success=False, hostname=hostname, error_message=str(e)
             )
 
+    def configure_servers(
+        self,
+        server_configs: List[MCPServerConfig],
+        hostname: str,
+        no_backup: bool = False,
+    ) -> List[ConfigurationResult]:
+        """Configure several MCP servers on a host in one read/write cycle.
+
+        The host configuration file is read, backed up and written only once.
+        Each configuration is first serialized with the host's adapter, so a
+        configuration the host rejects fails on its own with the adapter's
+        error while the others are still written.
+
+        Args:
+            server_configs: Server configurations to add or update
+            hostname: Target host identifier
+            no_backup: Skip backup creation
+
+        Returns:
+            List[ConfigurationResult]: One result per server configuration,
+            in the same order as server_configs
+        """
+        try:
+            host_type = MCPHostType(hostname)
+            strategy = self.host_registry.get_strategy(host_type)
+            adapter = get_adapter(hostname)
+        except Exception as e:
+            return [
+                ConfigurationResult(
+                    success=False, hostname=hostname, error_message=str(e)
+                )
+                for _ in server_configs
+            ]
+
+        results: List[Optional[ConfigurationResult]] = [None] * len(server_configs)
+        valid: List[int] = []
+        for i, server_config in enumerate(server_configs):
+            # Validate server configuration for this host
+            if not strategy.validate_server_config(server_config):
+                results[i] = ConfigurationResult(
+                    success=False,
+                    hostname=hostname,
+                    error_message=f"Server configuration invalid for {hostname}",
+                )
+                continue
+
+            # Serialize up front so a server the host rejects does not make
+            # the single write below fail for every other server
+            try:
+                adapter.serialize(server_config)
+            except Exception as e:
+                results[i] = ConfigurationResult(
+                    success=False,
+                    hostname=hostname,
+                    server_name=getattr(server_config, "name", "default_server"),
+                    error_message=str(e),
+                )
+                continue
+            valid.append(i)
+
+        if not valid:
+            return results
+
+        try:
+            # Read current configuration
+            current_config = strategy.read_configuration()
+
+            # Create backup if requested
+            backup_path = None
+            if not no_backup and self.backup_manager:
+                config_path = strategy.get_config_path()
+                if config_path and config_path.exists():
+                    backup_result = self.backup_manager.create_backup(
+                        config_path, hostname
+                    )
+                    if backup_result.success:
+                        backup_path = backup_result.backup_path
+
+            # Add all servers to configuration
+            for i in valid:
+                server_name = getattr(server_configs[i], "name", "default_server")
+                current_config.add_server(server_name, server_configs[i])
+
+            # Write updated configuration
+            success = strategy.write_configuration(current_config, no_backup=no_backup)
+
+            for i in valid:
+                results[i] = ConfigurationResult(
+                    success=success,
+                    hostname=hostname,
+                    server_name=getattr(server_configs[i], "name", "default_server"),
+                    backup_created=backup_path is not None,
+                    backup_path=backup_path,
+                    error_message=(
+                        None
+                        if success
+                        else f"Failed to write configuration for {hostname}"
+                    ),
+                )
+
+        except Exception as e:
+            for i in valid:
+                results[i] = ConfigurationResult(
+                    success=False, hostname=hostname, error_message=str(e)
+                )
+
+        return results
+
     def get_server_config(
         self, hostname: str, server_name: str
     ) -> Optional[MCPServerConfig]:
@@ -457,9 +590,7 @@ class MCPHostConfigurationManager:
                 if not env_data:
                     return []
 
-                source_servers = {}
-                for package in env_data.get_mcp_packages():
-                    source_servers[package.name] = package.configured_hosts
+                source_servers = self._environment_source_servers(env_data)
             else:
                 try:
                     host_type = MCPHostType(from_host)
@@ -494,6 +625,198 @@ class MCPHostConfigurationManager:
         except Exception:
             return []
 
+    @staticmethod
+    def _environment_source_servers(
+        env_data: Dict[str, Any],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Collect the configured MCP servers of a Hatch environment.
+
+        Each tracked server configuration is validated; entries that fail
+        (e.g. tracking data missing its transport fields) are skipped with a
+        warning rather than synced incomplete.
+
+        Args:
+            env_data (Dict[str, Any]): Environment data as stored by
+                HatchEnvironmentManager
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Package name (one server per package)
+            to per-host configuration mapping
+        """
+        source_servers = {}
+        for package in env_data.get("packages", []):
+            configured_hosts = package.get("configured_hosts")
+            if not configured_hosts:
+                continue
+
+            host_configs = {}
+            for hostname, host_config in configured_hosts.items():
+                try:
+                    server_config = MCPServerConfig.model_validate(
+                        host_config["server_config"]
+                    )
+                except (KeyError, ValidationError) as e:
+                    logger.warning(
+                        f"Skipping invalid server config for {package['name']} "
+                        f"on {hostname}: {e}"
+                    )
+                    continue
+                host_configs[hostname] = {**host_config, "server_config": server_config}
+            if host_configs:
+                source_servers[package["name"]] = host_configs
+        return source_servers
+
+    @staticmethod
+    def _select_servers_for_host(
+        target_host: str,
+        source_servers: Dict[str, Dict[str, Any]],
+        from_env: Optional[str],
+        from_host: Optional[str],
+    ) -> Dict[str, MCPServerConfig]:
+        """Pick the source configuration of each server for one target host.
+
+        Args:
+            target_host (str): Target host name
+            source_servers (Dict[str, Dict[str, Any]]): Server name to per-host
+                configuration mapping resolved from the sync source
+            from_env (str, optional): Source environment name
+            from_host (str, optional): Source host name
+
+        Returns:
+            Dict[str, MCPServerConfig]: Server name to configuration to write
+        """
+        selected = {}
+        for server_name, server_hosts in source_servers.items():
+            # Find appropriate server config for this target host
+            server_config = None
+
+            if from_env:
+                # For environment source, look for host-specific config
+                if target_host in server_hosts:
+                    server_config = server_hosts[target_host]["server_config"]
+                elif "claude-desktop" in server_hosts:
+                    # Fallback to claude-desktop config for compatibility
+                    server_config = server_hosts["claude-desktop"]["server_config"]
+            else:
+                # For host source, use the server config directly
+                if from_host in server_hosts:
+                    server_config = server_hosts[from_host]["server_config"]
+
+            if server_config:
+                selected[server_name] = server_config
+        return selected
+
+    def _sync_one(
+        self, job: _PendingSync, no_backup: bool, generate_reports: bool
+    ) -> Tuple[ConfigurationResult, int]:
+        """Sync one resolved target host from a worker thread.
+
+        The host is written in a fresh context copy with current_host set to
+        it, so concurrent workers never share that state.
+
+        Args:
+            job (_PendingSync): Resolved target host and its selected servers
+            no_backup (bool): Skip backup creation
+            generate_reports (bool): Generate detailed conversion reports
+
+        Returns:
+            Tuple[ConfigurationResult, int]: Result for the host and the
+            number of servers written to it
+        """
+        return copy_context().run(
+            _call_for_host,
+            job.host,
+            self._sync_servers_to_host,
+            job.host,
+            job.host_type,
+            job.strategy,
+            job.server_configs,
+            no_backup,
+            generate_reports,
+        )
+
+    def _sync_servers_to_host(
+        self,
+        target_host: str,
+        host_type: MCPHostType,
+        strategy: MCPHostStrategy,
+        server_configs: Dict[str, MCPServerConfig],
+        no_backup: bool,
+        generate_reports: bool,
+    ) -> Tuple[ConfigurationResult, int]:
+        """Write the selected servers to a single, already resolved target host.
+
+        Args:
+            target_host (str): Target host name
+            host_type (MCPHostType): Resolved target host type
+            strategy (MCPHostStrategy): Strategy for the target host
+            server_configs (Dict[str, MCPServerConfig]): Servers to add, as
+                selected by _select_servers_for_host()
+            no_backup (bool): Skip backup creation
+            generate_reports (bool): Generate detailed conversion reports
+
+        Returns:
+            Tuple[ConfigurationResult, int]: Result for the host and the number
+            of servers synchronized to it (0 unless the write succeeded)
+        """
+        try:
+            # Read current target configuration
+            current_config = strategy.read_configuration()
+
+            # Create backup if requested
+            backup_path = None
+            if not no_backup and self.backup_manager:
+                config_path = strategy.get_config_path()
+                if config_path and config_path.exists():
+                    backup_result = self.backup_manager.create_backup(
+                        config_path, target_host
+                    )
+                    if backup_result.success:
+                        backup_path = backup_result.backup_path
+
+            # Add servers to target configuration
+            host_conversion_reports = []
+
+            for server_name, server_config in server_configs.items():
+                # Get existing config for comparison (if any)
+                old_config = current_config.servers.get(server_name)
+
+                # Generate conversion report if requested
+                if generate_reports:
+                    from .reporting import generate_conversion_report
+
+                    report = generate_conversion_report(
+                        operation="update" if old_config else "create",
+                        server_name=server_name,
+                        target_host=host_type,
+                        config=server_config,
+                        old_config=old_config,
+                        dry_run=False,
+                    )
+                    host_conversion_reports.append(report)
+
+                current_config.add_server(server_name, server_config)
+
+            # Write updated configuration
+            success = strategy.write_configuration(current_config, no_backup=no_backup)
+
+            result = ConfigurationResult(
+                success=success,
+                hostname=target_host,
+                backup_created=backup_path is not None,
+                backup_path=backup_path,
+                conversion_reports=host_conversion_reports if generate_reports else [],
+            )
+            return result, len(server_configs) if success else 0
+
+        except Exception as e:
+            return (
+                ConfigurationResult(
+                    success=False, hostname=target_host, error_message=str(e)
+                ),
+                0,
+            )
+
     def sync_configurations(
         self,
         from_env: Optional[str] = None,
@@ -557,10 +880,7 @@ class MCPHostConfigurationManager:
                     )
 
                 # Extract servers from environment
-                source_servers = {}
-                for package in env_data.get_mcp_packages():
-                    # Use package name as server name (single server per package)
-                    source_servers[package.name] = package.configured_hosts
+                source_servers = self._environment_source_servers(env_data)
 
             else:  # from_host
                 # Read host configuration
@@ -609,94 +929,15 @@ class MCPHostConfigurationManager:
                 }
                 source_servers = filtered_servers
 
-            # Apply synchronization to target hosts
-            results = []
-            servers_synced = 0
-
-            for target_host in to_hosts:
+            # Phase 1 (no file access): resolve every target host and select
+            # its servers, so invalid hosts fail before any file is touched.
+            # Duplicates are dropped so no file is written by two workers.
+            results: List[Optional[ConfigurationResult]] = []
+            pending: List[_PendingSync] = []
+            for target_host in dict.fromkeys(to_hosts):
                 try:
                     host_type = MCPHostType(target_host)
                     strategy = self.host_registry.get_strategy(host_type)
-
-                    # Read current target configuration
-                    current_config = strategy.read_configuration()
-
-                    # Create backup if requested
-                    backup_path = None
-                    if not no_backup and self.backup_manager:
-                        config_path = strategy.get_config_path()
-                        if config_path and config_path.exists():
-                            backup_result = self.backup_manager.create_backup(
-                                config_path, target_host
-                            )
-                            if backup_result.success:
-                                backup_path = backup_result.backup_path
-
-                    # Add servers to target configuration
-                    host_servers_added = 0
-                    host_conversion_reports = []
-
-                    for server_name, server_hosts in source_servers.items():
-                        # Find appropriate server config for this target host
-                        server_config = None
-
-                        if from_env:
-                            # For environment source, look for host-specific config
-                            if target_host in server_hosts:
-                                server_config = server_hosts[target_host][
-                                    "server_config"
-                                ]
-                            elif "claude-desktop" in server_hosts:
-                                # Fallback to claude-desktop config for compatibility
-                                server_config = server_hosts["claude-desktop"][
-                                    "server_config"
-                                ]
-                        else:
-                            # For host source, use the server config directly
-                            if from_host in server_hosts:
-                                server_config = server_hosts[from_host]["server_config"]
-
-                        if server_config:
-                            # Get existing config for comparison (if any)
-                            old_config = current_config.servers.get(server_name)
-
-                            # Generate conversion report if requested
-                            if generate_reports:
-                                from .reporting import generate_conversion_report
-
-                                report = generate_conversion_report(
-                                    operation="update" if old_config else "create",
-                                    server_name=server_name,
-                                    target_host=host_type,
-                                    config=server_config,
-                                    old_config=old_config,
-                                    dry_run=False,
-                                )
-                                host_conversion_reports.append(report)
-
-                            current_config.add_server(server_name, server_config)
-                            host_servers_added += 1
-
-                    # Write updated configuration
-                    success = strategy.write_configuration(
-                        current_config, no_backup=no_backup
-                    )
-
-                    results.append(
-                        ConfigurationResult(
-                            success=success,
-                            hostname=target_host,
-                            backup_created=backup_path is not None,
-                            backup_path=backup_path,
-                            conversion_reports=host_conversion_reports
-                            if generate_reports
-                            else [],
-                        )
-                    )
-
-                    if success:
-                        servers_synced += host_servers_added
-
                 except ValueError:
                     results.append(
                         ConfigurationResult(
@@ -705,12 +946,42 @@ class MCPHostConfigurationManager:
                             error_message=f"Invalid target host '{target_host}'",
                         )
                     )
+                    continue
                 except Exception as e:
                     results.append(
                         ConfigurationResult(
                             success=False, hostname=target_host, error_message=str(e)
                         )
                     )
+                    continue
+
+                server_configs = self._select_servers_for_host(
+                    target_host, source_servers, from_env, from_host
+                )
+                pending.append(
+                    _PendingSync(
+                        len(results), target_host, host_type, strategy, server_configs
+                    )
+                )
+                results.append(None)
+
+            # Phase 2: read, back up and write each host's configuration file.
+            # Each host owns its own file, so hosts are written concurrently.
+            servers_synced = 0
+            if pending:
+                with ThreadPoolExecutor(
+                    max_workers=min(_MAX_SYNC_WORKERS, len(pending))
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            self._sync_one, job, no_backup, generate_reports
+                        )
+                        for job in pending
+                    ]
+                    for job, future in zip(pending, futures):
+                        result, host_servers_synced = future.result()
+                        results[job.index] = result
+                        servers_synced += host_servers_synced
 
             # Calculate summary statistics
             successful_results = [r for r in results if r.success]
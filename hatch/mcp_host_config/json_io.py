@@ -0,0 +1,37 @@
+"""JSON encoding for MCP host configuration files.
+
+Host configuration files are written with orjson when it is installed, which
+encodes nested dictionaries considerably faster than the standard library.
+orjson is optional; without it the standard json module is used. Both produce
+2-space indented, UTF-8 encoded JSON.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data: Any) -> bytes:
+    """Encode data as indented, UTF-8 encoded JSON.
+
+    Args:
+        data (Any): JSON-serializable data
+
+    Returns:
+        bytes: Encoded JSON document
+
+    Raises:
+        TypeError: If data is not JSON serializable
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson is stricter than json (e.g. non-str keys, integers beyond
+            # 64 bits); let the standard encoder handle or reject such data.
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
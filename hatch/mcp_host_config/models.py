@@ -6,18 +6,32 @@ environment data structures, and host configuration management following
 the v2 design specification with consolidated MCPServerConfig model.
 """
 
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
-from typing import Dict, List, Optional, Literal, TYPE_CHECKING
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
+from typing import Any, Dict, FrozenSet, List, Optional, Literal, Tuple, TYPE_CHECKING
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
 import logging
+import re
+import sys
 
 if TYPE_CHECKING:
     from .reporting import ConversionReport
 
 logger = logging.getLogger(__name__)
 
+# Mistral Vibe 'transport' values that denote HTTP streaming
+_HTTP_TRANSPORTS: FrozenSet[str] = frozenset({"http", "streamable-http"})
+
 
 class MCPHostType(str, Enum):
     """Enumeration of supported MCP host types."""
@@ -35,6 +49,14 @@ class MCPHostType(str, Enum):
     AUGMENT = "augment"
 
 
+# Package names: letters, digits, '-', '_' and '.', with at least one letter
+# or digit
+_PACKAGE_NAME_RE = re.compile(r"[\w.-]*[^\W_][\w.-]*")
+
+# Host names accepted in package host configuration records
+_SUPPORTED_HOST_NAMES: FrozenSet[str] = frozenset(host.value for host in MCPHostType)
+
+
 class MCPServerConfig(BaseModel):
     """Unified MCP server configuration containing ALL possible fields.
 
@@ -45,6 +67,12 @@ class MCPServerConfig(BaseModel):
     Design Notes:
         - extra="allow" for forward compatibility with unknown host fields
         - Minimal validation (adapters do host-specific validation)
+        - Fields are validated on construction only; assigning a field is
+          not validated and only clears the cached serialization results
+        - Nested values (args, env, headers, ...) must not be mutated in
+          place once the config has been serialized, since the cached
+          serialization results would not see the change; assign a new
+          value instead
         - 'name' field is Hatch metadata, never serialized to host configs
     """
 
@@ -197,6 +225,52 @@ class MCPServerConfig(BaseModel):
         description="Disable OAuth for OpenCode server (serializes as oauth: false)",
     )
 
+    # ========================================================================
+    # Serialization Cache (private, not a config field)
+    # ========================================================================
+    # Cached model_dump(exclude_none=True) shared by adapters, and filtered
+    # views of it keyed by adapter field set. Both are reset whenever a field
+    # is assigned so they never outlive the values they were built from.
+    _dump_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _filter_cache: Optional[Dict[FrozenSet[str], Dict[str, Any]]] = PrivateAttr(
+        default=None
+    )
+    # get_transport_type() result wrapped in a 1-tuple, since None is a
+    # valid result
+    _transport_cache: Optional[Tuple[Optional[str]]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._clear_serialization_cache()
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare configs by fields and extra fields only.
+
+        Pydantic's default equality also compares private attributes, which
+        here only hold the serialization caches; two identical configs must
+        stay equal whether or not one of them has been serialized.
+        """
+        if not isinstance(other, MCPServerConfig):
+            return NotImplemented
+        return (
+            type(self) is type(other)
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
+    def model_copy(self, *, update=None, deep: bool = False) -> "MCPServerConfig":
+        """Copy the model without carrying over the serialization cache."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._clear_serialization_cache()
+        return copied
+
+    def _clear_serialization_cache(self) -> None:
+        """Drop all cached serialization results and derived values."""
+        self._dump_cache = None
+        self._filter_cache = None
+        self._transport_cache = None
+
     # ========================================================================
     # Minimal Validators (host-specific validation is in adapters)
     # ========================================================================
@@ -204,10 +278,17 @@ class MCPServerConfig(BaseModel):
     @field_validator("command")
     @classmethod
     def validate_command_not_empty(cls, v):
-        """Validate command is not empty when provided."""
-        if v is not None and not v.strip():
+        """Validate command is not empty when provided.
+
+        Commands are interned: environments typically repeat a handful of
+        executables (python, node, npx, uvx) across many servers.
+        """
+        if v is None:
+            return v
+        command = v.strip()
+        if not command:
             raise ValueError("Command cannot be empty")
-        return v.strip() if v else v
+        return sys.intern(command)
 
     @field_validator("url", "httpUrl")
     @classmethod
@@ -290,7 +371,7 @@ class MCPServerConfig(BaseModel):
             2. Otherwise, presence of 'httpUrl' field indicates HTTP streaming
         """
         if self.transport is not None:
-            return self.transport in ("http", "streamable-http")
+            return self.transport in _HTTP_TRANSPORTS
         if self.type is not None:
             return self.type == "http"
         return self.httpUrl is not None
@@ -305,6 +386,14 @@ class MCPServerConfig(BaseModel):
             "streamable-http" for hosts that expose that transport natively
             None if transport cannot be determined
         """
+        # Cached until a field of the config is reassigned
+        cached = self._transport_cache
+        if cached is None:
+            cached = self._transport_cache = (self._compute_transport_type(),)
+        return cached[0]
+
+    def _compute_transport_type(self) -> Optional[str]:
+        """Determine the transport type from the config's fields."""
         if self.transport is not None:
             return self.transport
 
@@ -323,6 +412,58 @@ class MCPServerConfig(BaseModel):
         return None
 
 
+# Validates a whole {name: server data} mapping in a single pydantic-core call
+_SERVER_CONFIGS_ADAPTER = TypeAdapter(Dict[str, MCPServerConfig])
+
+
+def parse_server_configs(raw_servers: Dict[str, Any]) -> Dict[str, MCPServerConfig]:
+    """Build MCPServerConfig objects from raw host configuration entries.
+
+    All entries are validated in one batch. If any entry is invalid, entries
+    are validated one by one instead so that only the invalid ones are
+    skipped, each with a warning.
+
+    Args:
+        raw_servers: Mapping of server name to raw server configuration data
+
+    Returns:
+        Mapping of server name to validated MCPServerConfig
+    """
+    try:
+        return _SERVER_CONFIGS_ADAPTER.validate_python(raw_servers)
+    except ValidationError:
+        pass
+
+    servers = {}
+    for name, server_data in raw_servers.items():
+        try:
+            servers[name] = MCPServerConfig(**server_data)
+        except Exception as e:
+            logger.warning(f"Invalid server config for {name}: {e}")
+    return servers
+
+
+def _intern_config_path(path: str) -> str:
+    """Strip and intern a host config file path.
+
+    Every package configured on a host records the same config file path,
+    so interning keeps one copy per host instead of one per package.
+
+    Args:
+        path: Config file path as stored or given
+
+    Returns:
+        The stripped, interned path
+
+    Raises:
+        ValueError: If the path is empty
+    """
+    path = path.strip()
+    if not path:
+        raise ValueError("Config path cannot be empty")
+    return sys.intern(path)
+
+
 class HostConfigurationMetadata(BaseModel):
     """Metadata for host configuration tracking."""
 
@@ -334,9 +475,7 @@ class HostConfigurationMetadata(BaseModel):
     @classmethod
     def validate_config_path_not_empty(cls, v):
         """Validate config path is not empty."""
-        if not v.strip():
-            raise ValueError("Config path cannot be empty")
-        return v.strip()
+        return _intern_config_path(v)
 
 
 class PackageHostConfiguration(BaseModel):
@@ -353,9 +492,7 @@ class PackageHostConfiguration(BaseModel):
     @classmethod
     def validate_config_path_format(cls, v):
         """Validate config path format."""
-        if not v.strip():
-            raise ValueError("Config path cannot be empty")
-        return v.strip()
+        return _intern_config_path(v)
 
 
 class EnvironmentPackageEntry(BaseModel):
@@ -378,7 +515,7 @@ class EnvironmentPackageEntry(BaseModel):
         if not v.strip():
             raise ValueError("Package name cannot be empty")
         # Allow standard package naming patterns
-        if not v.replace("-", "").replace("_", "").replace(".", "").isalnum():
+        if _PACKAGE_NAME_RE.fullmatch(v) is None:
             raise ValueError(f"Invalid package name format: {v}")
         return v.strip()
 
@@ -386,24 +523,12 @@ class EnvironmentPackageEntry(BaseModel):
     @classmethod
     def validate_host_names(cls, v):
         """Validate host names are supported."""
-        supported_hosts = {
-            "claude-desktop",
-            "claude-code",
-            "vscode",
-            "cursor",
-            "lmstudio",
-            "gemini",
-            "kiro",
-            "codex",
-            "mistral-vibe",
-            "opencode",
-            "augment",
-        }
-        for host_name in v.keys():
-            if host_name not in supported_hosts:
-                raise ValueError(
-                    f"Unsupported host: {host_name}. Supported: {supported_hosts}"
-                )
+        if not v.keys() <= _SUPPORTED_HOST_NAMES:
+            host_name = next(h for h in v if h not in _SUPPORTED_HOST_NAMES)
+            raise ValueError(
+                f"Unsupported host: {host_name}. "
+                f"Supported: {', '.join(sorted(_SUPPORTED_HOST_NAMES))}"
+            )
         return v
 
 
@@ -468,21 +593,17 @@ class EnvironmentData(BaseModel):
 class HostConfiguration(BaseModel):
     """Host configuration file structure using consolidated MCPServerConfig."""
 
+    # Pydantic type-checks each entry; MCPServerConfig instances are kept
+    # as-is rather than revalidated.
     servers: Dict[str, MCPServerConfig] = Field(
         default_factory=dict, description="Configured MCP servers"
     )
 
-    @field_validator("servers")
-    @classmethod
-    def validate_servers_not_empty_when_present(cls, v):
-        """Validate servers dict structure."""
-        for server_name, config in v.items():
-            if not isinstance(config, (dict, MCPServerConfig)):
-                raise ValueError(f"Invalid server config for {server_name}")
-        return v
-
     def add_server(self, name: str, config: MCPServerConfig):
-        """Add server configuration."""
+        """Add server configuration.
+
+        The config is stored as-is; it was validated when it was created.
+        """
         self.servers[name] = config
 
     def remove_server(self, name: str) -> bool:
@@ -542,7 +663,7 @@ class SyncResult(BaseModel):
         """Calculate success rate percentage."""
         if not self.results:
             return 0.0
-        successful = len([r for r in self.results if r.success])
+        successful = sum(1 for r in self.results if r.success)
         return (successful / len(self.results)) * 100.0
 
 
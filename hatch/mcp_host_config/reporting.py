@@ -119,6 +119,12 @@ def generate_conversion_report(
 
     field_operations = []
     set_fields = config.model_dump(exclude_unset=True)
+    # Only supported fields are compared against the old config
+    old_fields = (
+        old_config.model_dump(exclude_unset=True, include=supported_fields)
+        if old_config
+        else None
+    )
 
     for field_name, new_value in set_fields.items():
         # Skip metadata fields (e.g., 'name') - they should never appear in reports
@@ -127,9 +133,8 @@ def generate_conversion_report(
 
         if field_name in supported_fields:
             # Field is supported by target host
-            if old_config:
+            if old_fields is not None:
                 # Update operation - check if field changed
-                old_fields = old_config.model_dump(exclude_unset=True)
                 if field_name in old_fields:
                     old_value = old_fields[field_name]
                     if old_value != new_value:
@@ -16,8 +16,14 @@ from typing import Optional, Dict, Any, TextIO
 import logging
 
 from .host_management import MCPHostStrategy, register_host_strategy
-from .models import MCPHostType, MCPServerConfig, HostConfiguration
+from .models import (
+    MCPHostType,
+    MCPServerConfig,
+    HostConfiguration,
+    parse_server_configs,
+)
 from .backup import MCPHostConfigBackupManager, AtomicFileOperations
+from .json_io import dumps_json
 from .adapters import get_adapter
 from .adapters.opencode import OpenCodeAdapter
 
@@ -76,20 +82,14 @@ class ClaudeHostStrategy(MCPHostStrategy):
             return HostConfiguration()
 
         try:
-            with open(config_path, "r") as f:
+            with open(config_path, "r", encoding="utf-8") as f:
                 config_data = json.load(f)
 
             # Extract MCP servers from Claude configuration
             mcp_servers = config_data.get(self.get_config_key(), {})
 
             # Convert to MCPServerConfig objects
-            servers = {}
-            for name, server_data in mcp_servers.items():
-                try:
-                    servers[name] = MCPServerConfig(**server_data)
-                except Exception as e:
-                    logger.warning(f"Invalid server config for {name}: {e}")
-                    continue
+            servers = parse_server_configs(mcp_servers)
 
             return HostConfiguration(servers=servers)
 
@@ -113,16 +113,14 @@ class ClaudeHostStrategy(MCPHostStrategy):
             existing_config = {}
             if config_path.exists():
                 try:
-                    with open(config_path, "r") as f:
+                    with open(config_path, "r", encoding="utf-8") as f:
                         existing_config = json.load(f)
                 except Exception:
                     pass  # Start with empty config if read fails
 
             # Use adapter for serialization (includes validation and field filtering)
             adapter = get_adapter(self.get_adapter_host_name())
-            servers_dict = {}
-            for name, server_config in config.servers.items():
-                servers_dict[name] = adapter.serialize(server_config)
+            servers_dict = adapter.serialize_many(config.servers)
 
             # Preserve Claude-specific settings
             updated_config = self._preserve_claude_settings(
@@ -131,8 +129,7 @@ class ClaudeHostStrategy(MCPHostStrategy):
 
             # Write atomically
             temp_path = config_path.with_suffix(".tmp")
-            with open(temp_path, "w") as f:
-                json.dump(updated_config, f, indent=2)
+            temp_path.write_bytes(dumps_json(updated_config))
 
             temp_path.replace(config_path)
             return True
@@ -253,20 +250,14 @@ class CursorBasedHostStrategy(MCPHostStrategy):
             return HostConfiguration()
 
         try:
-            with open(config_path, "r") as f:
+            with open(config_path, "r", encoding="utf-8") as f:
                 config_data = json.load(f)
 
             # Extract MCP servers
             mcp_servers = config_data.get(self.get_config_key(), {})
 
             # Convert to MCPServerConfig objects
-            servers = {}
-            for name, server_data in mcp_servers.items():
-                try:
-                    servers[name] = MCPServerConfig(**server_data)
-                except Exception as e:
-                    logger.warning(f"Invalid server config for {name}: {e}")
-                    continue
+            servers = parse_server_configs(mcp_servers)
 
             return HostConfiguration(servers=servers)
 
@@ -290,24 +281,21 @@ class CursorBasedHostStrategy(MCPHostStrategy):
             existing_config = {}
             if config_path.exists():
                 try:
-                    with open(config_path, "r") as f:
+                    with open(config_path, "r", encoding="utf-8") as f:
                         existing_config = json.load(f)
                 except Exception:
                     pass
 
             # Use adapter for serialization (includes validation and field filtering)
             adapter = get_adapter(self.get_adapter_host_name())
-            servers_dict = {}
-            for name, server_config in config.servers.items():
-                servers_dict[name] = adapter.serialize(server_config)
+            servers_dict = adapter.serialize_many(config.servers)
 
             # Update configuration
             existing_config[self.get_config_key()] = servers_dict
 
             # Write atomically
             temp_path = config_path.with_suffix(".tmp")
-            with open(temp_path, "w") as f:
-                json.dump(existing_config, f, indent=2)
+            temp_path.write_bytes(dumps_json(existing_config))
 
             temp_path.replace(config_path)
             return True
@@ -412,20 +400,14 @@ class VSCodeHostStrategy(MCPHostStrategy):
             return HostConfiguration()
 
         try:
-            with open(config_path, "r") as f:
+            with open(config_path, "r", encoding="utf-8") as f:
                 config_data = json.load(f)
 
             # Extract MCP servers from direct structure
             mcp_servers = config_data.get(self.get_config_key(), {})
 
             # Convert to MCPServerConfig objects
-            servers = {}
-            for name, server_data in mcp_servers.items():
-                try:
-                    servers[name] = MCPServerConfig(**server_data)
-                except Exception as e:
-                    logger.warning(f"Invalid server config for {name}: {e}")
-                    continue
+            servers = parse_server_configs(mcp_servers)
 
             return HostConfiguration(servers=servers)
 
@@ -449,24 +431,21 @@ class VSCodeHostStrategy(MCPHostStrategy):
             existing_config = {}
             if config_path.exists():
                 try:
-                    with open(config_path, "r") as f:
+                    with open(config_path, "r", encoding="utf-8") as f:
                         existing_config = json.load(f)
                 except Exception:
                     pass
 
             # Use adapter for serialization (includes validation and field filtering)
             adapter = get_adapter(self.get_adapter_host_name())
-            servers_dict = {}
-            for name, server_config in config.servers.items():
-                servers_dict[name] = adapter.serialize(server_config)
+            servers_dict = adapter.serialize_many(config.servers)
 
             # Update configuration with new servers (preserves non-MCP settings)
             existing_config[self.get_config_key()] = servers_dict
 
             # Write atomically
             temp_path = config_path.with_suffix(".tmp")
-            with open(temp_path, "w") as f:
-                json.dump(existing_config, f, indent=2)
+            temp_path.write_bytes(dumps_json(existing_config))
 
             temp_path.replace(config_path)
             return True
@@ -515,15 +494,8 @@ class KiroHostStrategy(MCPHostStrategy):
             with open(config_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
-            servers = {}
             mcp_servers = data.get(self.get_config_key(), {})
-
-            for name, config in mcp_servers.items():
-                try:
-                    servers[name] = MCPServerConfig(**config)
-                except Exception as e:
-                    logger.warning(f"Invalid server config for {name}: {e}")
-                    continue
+            servers = parse_server_configs(mcp_servers)
 
             return HostConfiguration(servers=servers)
 
@@ -553,9 +525,7 @@ class KiroHostStrategy(MCPHostStrategy):
 
             # Use adapter for serialization (includes validation and field filtering)
             adapter = get_adapter(self.get_adapter_host_name())
-            servers_data = {}
-            for name, server_config in config.servers.items():
-                servers_data[name] = adapter.serialize(server_config)
+            servers_data = adapter.serialize_many(config.servers)
 
             existing_data[self.get_config_key()] = servers_data
 
@@ -613,20 +583,14 @@ class GeminiHostStrategy(MCPHostStrategy):
             return HostConfiguration()
 
         try:
-            with open(config_path, "r") as f:
+            with open(config_path, "r", encoding="utf-8") as f:
                 config_data = json.load(f)
 
             # Extract MCP servers from Gemini configuration
             mcp_servers = config_data.get(self.get_config_key(), {})
 
             # Convert to MCPServerConfig objects
-            servers = {}
-            for name, server_data in mcp_servers.items():
-                try:
-                    servers[name] = MCPServerConfig(**server_data)
-                except Exception as e:
-                    logger.warning(f"Invalid server config for {name}: {e}")
-                    continue
+            servers = parse_server_configs(mcp_servers)
 
             return HostConfiguration(servers=servers)
 
@@ -650,16 +614,14 @@ class GeminiHostStrategy(MCPHostStrategy):
             existing_config = {}
             if config_path.exists():
                 try:
-                    with open(config_path, "r") as f:
+                    with open(config_path, "r", encoding="utf-8") as f:
                         existing_config = json.load(f)
                 except Exception:
                     pass
 
             # Use adapter for serialization (includes validation and field filtering)
             adapter = get_adapter(self.get_adapter_host_name())
-            servers_dict = {}
-            for name, server_config in config.servers.items():
-                servers_dict[name] = adapter.serialize(server_config)
+            servers_dict = adapter.serialize_many(config.servers)
 
             # Update configuration with new servers (preserves non-MCP settings)
             existing_config[self.get_config_key()] = servers_dict
@@ -667,11 +629,10 @@ class GeminiHostStrategy(MCPHostStrategy):
             # Write atomically with enhanced error handling
             temp_path = config_path.with_suffix(".tmp")
             try:
-                with open(temp_path, "w") as f:
-                    json.dump(existing_config, f, indent=2, ensure_ascii=False)
+                temp_path.write_bytes(dumps_json(existing_config))
 
                 # Verify the JSON is valid by reading it back
-                with open(temp_path, "r") as f:
+                with open(temp_path, "r", encoding="utf-8") as f:
                     json.load(f)  # This will raise an exception if JSON is invalid
 
                 # Only replace if verification succeeds
@@ -780,11 +741,11 @@ class CodexHostStrategy(MCPHostStrategy):
 
             # Use adapter for serialization (includes validation and field filtering)
             adapter = get_adapter(self.get_adapter_host_name())
-            servers_data = {}
-            for name, server_config in config.servers.items():
-                # Adapter serializes and filters fields, then apply TOML-specific transforms
-                serialized = adapter.serialize(server_config)
-                servers_data[name] = self._to_toml_server_from_dict(serialized)
+            # Adapter serializes and filters fields, then apply TOML-specific transforms
+            servers_data = {
+                name: self._to_toml_server_from_dict(serialized)
+                for name, serialized in adapter.serialize_many(config.servers).items()
+            }
 
             # Build final TOML structure
             final_data = {}
@@ -1029,10 +990,10 @@ class OpenCodeHostStrategy(MCPHostStrategy):
             # Serialize all servers using the OpenCode adapter, then apply
             # structural transforms to produce OpenCode-native file format
             adapter = get_adapter(self.get_adapter_host_name())
-            servers_dict = {}
-            for name, server_config in config.servers.items():
-                canonical = adapter.serialize(server_config)
-                servers_dict[name] = OpenCodeAdapter.to_native_format(canonical)
+            servers_dict = {
+                name: OpenCodeAdapter.to_native_format(canonical)
+                for name, canonical in adapter.serialize_many(config.servers).items()
+            }
 
             existing_data[self.get_config_key()] = servers_dict
 
@@ -1170,10 +1131,10 @@ class MistralVibeHostStrategy(MCPHostStrategy):
                     pass
 
             adapter = get_adapter(self.get_adapter_host_name())
-            servers_data = []
-            for name, server_config in config.servers.items():
-                serialized = adapter.serialize(server_config)
-                servers_data.append({"name": name, **serialized})
+            servers_data = [
+                {"name": name, **serialized}
+                for name, serialized in adapter.serialize_many(config.servers).items()
+            ]
 
             final_data = {
                 key: value
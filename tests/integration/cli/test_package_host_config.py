@@ -0,0 +1,382 @@
+"""Integration tests for package-level MCP host configuration.
+
+These tests cover the host configuration paths of 'hatch package add --host'
+and 'hatch package sync', which resolve MCP server configurations for a
+package and its dependencies and configure them on the requested hosts.
+
+Test Coverage:
+    - Package lookup through the environment package index
+    - Single resolution of server configurations per package
+    - Conversion reports generated only when rendered
+    - Repeated --host entries handled once
+    - One configuration batch per host
+    - Batched host configuration tracking updates
+    - Early exit when no hosts are available
+    - Local dependency path resolution
+"""
+
+import io
+import json
+from argparse import Namespace
+from unittest.mock import MagicMock, patch
+
+from hatch.cli.cli_package import (
+    _configure_packages_on_hosts,
+    _get_package_names_with_dependencies,
+    _local_package_service,
+    _resolve_local_dep_name,
+    _resolve_package_server_configs,
+    handle_package_add,
+    handle_package_sync,
+)
+from hatch.cli.cli_utils import EXIT_SUCCESS
+from hatch.mcp_host_config.models import ConfigurationResult, MCPServerConfig
+from hatch.mcp_host_config.reporting import generate_conversion_report
+
+
+def _make_env_manager(packages=None):
+    """Create a mock env_manager exposing a package index."""
+    env_manager = MagicMock()
+    env_manager.get_current_environment.return_value = "default"
+    env_manager.get_environment_package_index.return_value = {
+        pkg["name"]: pkg for pkg in (packages or [])
+    }
+    return env_manager
+
+
+def _make_mcp_manager(failing=()):
+    """Create a mock mcp_manager whose batch configuration fails for `failing`."""
+    mcp_manager = MagicMock()
+    mcp_manager.configure_servers.side_effect = (
+        lambda hostname, server_configs, no_backup: [
+            ConfigurationResult(
+                success=config.name not in failing,
+                hostname=hostname,
+                server_name=config.name,
+                error_message="boom" if config.name in failing else None,
+            )
+            for config in server_configs
+        ]
+    )
+    return mcp_manager
+
+
+def _write_local_package(package_dir, name, hatch_deps=None):
+    """Write a minimal hatch_metadata.json for a local package directory."""
+    package_dir.mkdir(parents=True, exist_ok=True)
+    metadata = {
+        "package_schema_version": "1.2.1",
+        "name": name,
+        "version": "1.0.0",
+        "entry_point": {"mcp_server": "mcp_server.py"},
+        "dependencies": {"hatch": hatch_deps or []},
+    }
+    (package_dir / "hatch_metadata.json").write_text(json.dumps(metadata))
+    return package_dir
+
+
+def _server_config(pkg_name):
+    return MCPServerConfig(name=pkg_name, command="python", args=[f"{pkg_name}.py"])
+
+
+class TestPackageServerConfigResolution:
+    """Tests for MCP server configuration resolution across packages."""
+
+    def test_duplicate_package_names_resolved_once(self):
+        """Shared dependencies should only be resolved once, in first-seen order."""
+        env_manager = _make_env_manager()
+
+        with patch(
+            "hatch.cli.cli_package.get_package_mcp_server_config",
+            side_effect=lambda _em, _env, name: _server_config(name),
+        ) as mock_get_config:
+            server_configs = _resolve_package_server_configs(
+                env_manager, "default", ["dep-a", "dep-b", "dep-a", "main"]
+            )
+
+        assert [name for name, _ in server_configs] == ["dep-a", "dep-b", "main"]
+        assert mock_get_config.call_count == 3
+
+    def test_sync_resolves_each_package_once(self):
+        """package sync should not re-resolve configurations after confirmation."""
+        env_manager = _make_env_manager(
+            packages=[{"name": "weather-server", "version": "1.0.0"}]
+        )
+        mcp_manager = _make_mcp_manager()
+
+        args = Namespace(
+            env_manager=env_manager,
+            mcp_manager=mcp_manager,
+            package_name="weather-server",
+            host="claude-desktop",
+            env=None,
+            dry_run=False,
+            auto_approve=True,
+            no_backup=True,
+        )
+
+        with patch(
+            "hatch.cli.cli_package.get_package_mcp_server_config",
+            side_effect=lambda _em, _env, name: _server_config(name),
+        ) as mock_get_config:
+            with patch("sys.stdout", io.StringIO()):
+                result = handle_package_sync(args)
+
+        assert result == EXIT_SUCCESS
+        env_manager.get_environment_package_index.assert_called_with("default")
+        assert mock_get_config.call_count == 1
+        mcp_manager.configure_servers.assert_called_once()
+
+    def test_sync_reports_missing_environment(self):
+        """Only a failed environment lookup is reported as inaccessible."""
+        env_manager = _make_env_manager()
+        env_manager.get_environment_package_index.side_effect = KeyError("missing")
+
+        args = Namespace(
+            env_manager=env_manager,
+            mcp_manager=_make_mcp_manager(),
+            package_name="weather-server",
+            host="claude-desktop",
+            env="missing",
+            dry_run=False,
+            auto_approve=True,
+            no_backup=True,
+        )
+
+        with patch(
+            "hatch.cli.cli_package.get_package_mcp_server_config",
+            side_effect=lambda _em, _env, name: _server_config(name),
+        ):
+            captured = io.StringIO()
+            with patch("sys.stdout", captured):
+                handle_package_sync(args)
+
+        assert "Could not access environment 'missing'" in captured.getvalue()
+
+    def test_sync_generates_conversion_reports_only_for_preview(self):
+        """Reports are built for the preview, not again when configuring."""
+        env_manager = _make_env_manager(
+            packages=[{"name": "weather-server", "version": "1.0.0"}]
+        )
+        mcp_manager = _make_mcp_manager()
+
+        args = Namespace(
+            env_manager=env_manager,
+            mcp_manager=mcp_manager,
+            package_name="weather-server",
+            host="claude-desktop,cursor",
+            env=None,
+            dry_run=False,
+            auto_approve=True,
+            no_backup=True,
+        )
+
+        with patch(
+            "hatch.cli.cli_package.get_package_mcp_server_config",
+            side_effect=lambda _em, _env, name: _server_config(name),
+        ), patch(
+            "hatch.cli.cli_package.generate_conversion_report",
+            wraps=generate_conversion_report,
+        ) as mock_report:
+            with patch("sys.stdout", io.StringIO()):
+                result = handle_package_sync(args)
+
+        assert result == EXIT_SUCCESS
+        assert mock_report.call_count == 2
+        assert mcp_manager.configure_servers.call_count == 2
+
+    def test_sync_configures_repeated_host_once(self):
+        """A host listed twice in --host should only be configured once."""
+        env_manager = _make_env_manager(
+            packages=[{"name": "weather-server", "version": "1.0.0"}]
+        )
+        mcp_manager = _make_mcp_manager()
+
+        args = Namespace(
+            env_manager=env_manager,
+            mcp_manager=mcp_manager,
+            package_name="weather-server",
+            host="cursor, cursor",
+            env=None,
+            dry_run=False,
+            auto_approve=True,
+            no_backup=True,
+        )
+
+        with patch(
+            "hatch.cli.cli_package.get_package_mcp_server_config",
+            side_effect=lambda _em, _env, name: _server_config(name),
+        ):
+            with patch("sys.stdout", io.StringIO()):
+                result = handle_package_sync(args)
+
+        assert result == EXIT_SUCCESS
+        mcp_manager.configure_servers.assert_called_once()
+
+
+class TestHostConfigurationTracking:
+    """Tests for recording host configurations in environment metadata."""
+
+    def test_tracking_updates_persisted_in_one_batch(self):
+        """Successful configurations are recorded through a single batch call."""
+        env_manager = _make_env_manager()
+        mcp_manager = _make_mcp_manager(failing={"broken"})
+        server_configs = [
+            ("pkg-a", _server_config("pkg-a")),
+            ("broken", _server_config("broken")),
+        ]
+
+        with patch("sys.stdout", io.StringIO()):
+            success_count, total = _configure_packages_on_hosts(
+                env_manager=env_manager,
+                mcp_manager=mcp_manager,
+                env_name="default",
+                package_names=["pkg-a", "broken"],
+                hosts=["claude-desktop", "cursor"],
+                server_configs=server_configs,
+            )
+
+        assert (success_count, total) == (2, 4)
+        # One batched configuration call per host
+        assert mcp_manager.configure_servers.call_count == 2
+        mcp_manager.configure_server.assert_not_called()
+        env_manager.update_package_host_configuration.assert_not_called()
+        env_manager.batch_update_package_host_configurations.assert_called_once()
+        (
+            env_name,
+            updates,
+        ) = env_manager.batch_update_package_host_configurations.call_args.args
+        assert env_name == "default"
+        assert [(pkg, host) for pkg, host, _ in updates] == [
+            ("pkg-a", "claude-desktop"),
+            ("pkg-a", "cursor"),
+        ]
+        assert updates[0][2] == {
+            "name": "pkg-a",
+            "command": "python",
+            "args": ["pkg-a.py"],
+        }
+
+
+class TestNoAvailableHosts:
+    """Tests for skipping package analysis when there are no hosts."""
+
+    def test_add_skips_dependency_analysis_without_hosts(self):
+        """'--host all' with no detected hosts should not analyse dependencies."""
+        env_manager = _make_env_manager()
+        env_manager.add_package_to_environment.return_value = True
+
+        args = Namespace(
+            env_manager=env_manager,
+            mcp_manager=MagicMock(),
+            package_path_or_name="weather-server",
+            host="all",
+            dry_run=False,
+        )
+
+        with patch("hatch.cli.cli_package.parse_host_list", return_value=[]), patch(
+            "hatch.cli.cli_package._get_package_names_with_dependencies"
+        ) as mock_deps:
+            captured = io.StringIO()
+            with patch("sys.stdout", captured):
+                result = handle_package_add(args)
+
+        assert result == EXIT_SUCCESS
+        mock_deps.assert_not_called()
+        assert "No MCP hosts available to configure" in captured.getvalue()
+
+    def test_sync_skips_config_resolution_without_hosts(self):
+        """package sync with no hosts should not resolve server configurations."""
+        args = Namespace(
+            env_manager=_make_env_manager(),
+            mcp_manager=MagicMock(),
+            package_name="weather-server",
+            host="all",
+        )
+
+        with patch("hatch.cli.cli_package.parse_host_list", return_value=[]), patch(
+            "hatch.cli.cli_package.get_package_mcp_server_config"
+        ) as mock_get_config:
+            with patch("sys.stdout", io.StringIO()):
+                result = handle_package_sync(args)
+
+        assert result == EXIT_SUCCESS
+        mock_get_config.assert_not_called()
+
+
+class TestLocalDependencyResolution:
+    """Tests for resolving local package paths to package names."""
+
+    def test_local_dependency_paths_resolved_to_names(self, tmp_path):
+        """Local dependency paths should be replaced by their package names."""
+        dep_dir = _write_local_package(tmp_path / "dep", "dep-pkg")
+        main_dir = _write_local_package(
+            tmp_path / "main",
+            "main-pkg",
+            hatch_deps=[
+                {"name": str(dep_dir), "version_constraint": ">=1.0.0"},
+                {"name": "registry-pkg", "version_constraint": ">=1.0.0"},
+            ],
+        )
+
+        (
+            package_name,
+            package_names,
+            package_service,
+        ) = _get_package_names_with_dependencies(
+            _make_env_manager(), str(main_dir), "default"
+        )
+
+        assert package_name == "main-pkg"
+        assert package_names == ["dep-pkg", "registry-pkg", "main-pkg"]
+        assert package_service is not None
+
+    def test_local_package_metadata_loaded_once(self, tmp_path):
+        """A directory used several times in one command is only parsed once."""
+        dep_dir = _write_local_package(tmp_path / "dep", "dep-pkg")
+        services = {}
+
+        first = _local_package_service(dep_dir.resolve(), services)
+        second = _local_package_service(dep_dir.resolve(), services)
+
+        assert first is second
+        assert list(services) == [dep_dir.resolve()]
+
+    def test_dependency_on_main_package_directory_reuses_metadata(self, tmp_path):
+        """A dependency path equal to the main package reuses its parsed name."""
+        main_dir = tmp_path / "main"
+        _write_local_package(
+            main_dir,
+            "main-pkg",
+            hatch_deps=[{"name": str(main_dir), "version_constraint": ">=1.0.0"}],
+        )
+
+        with patch("hatch.cli.cli_package.json.load", wraps=json.load) as mock_load:
+            _, package_names, _ = _get_package_names_with_dependencies(
+                _make_env_manager(), str(main_dir), "default"
+            )
+
+        assert package_names == ["main-pkg", "main-pkg"]
+        assert mock_load.call_count == 1
+
+    def test_edited_metadata_picked_up_by_next_command(self, tmp_path):
+        """Local package metadata is not cached across commands."""
+        main_dir = _write_local_package(tmp_path / "main", "main-pkg")
+        _get_package_names_with_dependencies(
+            _make_env_manager(), str(main_dir), "default"
+        )
+
+        _write_local_package(main_dir, "renamed-pkg")
+        package_name, _, _ = _get_package_names_with_dependencies(
+            _make_env_manager(), str(main_dir), "default"
+        )
+
+        assert package_name == "renamed-pkg"
+
+    def test_registry_style_names_are_not_treated_as_paths(self, tmp_path, monkeypatch):
+        """Bare names are registry packages even if a same-named directory exists."""
+        _write_local_package(tmp_path / "sibling", "sibling-pkg")
+        monkeypatch.chdir(tmp_path)
+
+        assert _resolve_local_dep_name("sibling", {}) == "sibling"
+        assert _resolve_local_dep_name("./sibling", {}) == "sibling-pkg"
@@ -5,6 +5,7 @@ This module tests:
 - ValidationError exception class
 - format_validation_error utility
 - format_info utility
+- format_warnings utility
 
 Reference: R13 §4.2.1 (13-error_message_formatting_v0.md) - HatchArgumentParser
 Reference: R13 §4.2.2 (13-error_message_formatting_v0.md) - ValidationError
@@ -317,3 +318,46 @@ class TestFormatInfo(unittest.TestCase):
 
         output = captured.getvalue().strip()
         self.assertEqual(output, "[INFO] Test message")
+
+
+class TestFormatWarnings(unittest.TestCase):
+    """Tests for format_warnings batch utility."""
+
+    def test_format_warnings_matches_format_warning(self):
+        """format_warnings output should equal repeated format_warning calls."""
+        from hatch.cli.cli_utils import format_warning, format_warnings
+        import io
+        import sys
+
+        warnings = [
+            ("Failed to configure a on cursor", "Reason: boom"),
+            ("Failed to update package metadata for b", None),
+        ]
+
+        captured_single = io.StringIO()
+        captured_batch = io.StringIO()
+        try:
+            sys.stdout = captured_single
+            for message, suggestion in warnings:
+                format_warning(message, suggestion=suggestion)
+            sys.stdout = captured_batch
+            format_warnings(warnings)
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(captured_batch.getvalue(), captured_single.getvalue())
+
+    def test_format_warnings_empty_prints_nothing(self):
+        """format_warnings should not print anything for an empty list."""
+        from hatch.cli.cli_utils import format_warnings
+        import io
+        import sys
+
+        captured = io.StringIO()
+        sys.stdout = captured
+        try:
+            format_warnings([])
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(captured.getvalue(), "")
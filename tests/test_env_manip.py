@@ -1248,6 +1248,147 @@ class PackageEnvironmentTests(unittest.TestCase):
             result, "Environment variable 'yes' should enable auto-approval"
         )
 
+    @regression_test
+    def test_environment_package_index_cache(self):
+        """The package index is reused until the environments are saved or reloaded."""
+        self.env_manager.create_environment(
+            "test_env", "Test environment", create_python_env=False
+        )
+        index = self.env_manager.get_environment_package_index("test_env")
+        self.assertEqual(index, {})
+        self.assertIs(self.env_manager.get_environment_package_index("test_env"), index)
+
+        # Saving rebuilds the index
+        self.env_manager.get_environments()["test_env"]["packages"].append(
+            {"name": "manual_pkg", "version": "1.0.0"}
+        )
+        self.env_manager._save_environments()
+        index = self.env_manager.get_environment_package_index("test_env")
+        self.assertEqual(list(index), ["manual_pkg"])
+
+        # Reloading picks up changes made to the environments file on disk
+        with open(self.env_manager.environments_file, "r") as f:
+            environments = json.load(f)
+        environments["test_env"]["packages"].append({"version": "1.0.0"})
+        environments["test_env"]["packages"].append(
+            {"name": "disk_pkg", "version": "2.0.0"}
+        )
+        with open(self.env_manager.environments_file, "w") as f:
+            json.dump(environments, f)
+        self.assertNotIn(
+            "disk_pkg", self.env_manager.get_environment_package_index("test_env")
+        )
+
+        self.env_manager.reload_environments()
+        index = self.env_manager.get_environment_package_index("test_env")
+        # Entries without a name are left out of the index
+        self.assertEqual(list(index), ["manual_pkg", "disk_pkg"])
+
+    def _create_env_with_base_pkg(self, env_name):
+        """Create an environment without Python holding the base_pkg test package."""
+        self.env_manager.create_environment(
+            env_name, "Test environment", create_python_env=False
+        )
+
+        from test_data_utils import TestDataLoader
+
+        pkg_path = TestDataLoader().packages_dir / "basic" / "base_pkg"
+        self.assertTrue(
+            self.env_manager.add_package_to_environment(
+                str(pkg_path), env_name, auto_approve=True
+            ),
+            "Failed to add base_pkg to environment",
+        )
+
+    def _configured_hosts(self, env_name):
+        """Read base_pkg's configured hosts back from the environments file."""
+        self.env_manager.reload_environments()
+        index = self.env_manager.get_environment_package_index(env_name)
+        return index["base_pkg"].get("configured_hosts", {})
+
+    @regression_test
+    def test_batch_update_package_host_configurations_saves_once(self):
+        """All batched host configuration updates are persisted in one save."""
+        self._create_env_with_base_pkg("test_env")
+        server_config = {"name": "base_pkg", "command": "python", "args": []}
+
+        with patch.object(
+            self.env_manager,
+            "_save_environments",
+            wraps=self.env_manager._save_environments,
+        ) as mock_save:
+            updated = self.env_manager.batch_update_package_host_configurations(
+                "test_env",
+                [
+                    ("base_pkg", "claude-desktop", server_config),
+                    ("base_pkg", "cursor", server_config),
+                ],
+            )
+
+        self.assertEqual(updated, 2)
+        mock_save.assert_called_once()
+        configured_hosts = self._configured_hosts("test_env")
+        self.assertEqual(set(configured_hosts), {"claude-desktop", "cursor"})
+        self.assertEqual(configured_hosts["cursor"]["server_config"], server_config)
+
+    @regression_test
+    def test_batch_update_package_host_configurations_transfers_conflicts(self):
+        """A host configured from another environment moves to the target."""
+        self._create_env_with_base_pkg("other_env")
+        self._create_env_with_base_pkg("test_env")
+        server_config = {"name": "base_pkg", "command": "python", "args": []}
+        self.env_manager.update_package_host_configuration(
+            "other_env", "base_pkg", "cursor", server_config
+        )
+
+        with patch.object(
+            self.env_manager,
+            "_save_environments",
+            wraps=self.env_manager._save_environments,
+        ) as mock_save:
+            updated = self.env_manager.batch_update_package_host_configurations(
+                "test_env", [("base_pkg", "cursor", server_config)]
+            )
+
+        self.assertEqual(updated, 1)
+        mock_save.assert_called_once()
+        self.assertIn("cursor", self._configured_hosts("test_env"))
+        self.assertNotIn("cursor", self._configured_hosts("other_env"))
+
+    @regression_test
+    def test_batch_update_package_host_configurations_saves_after_failure(self):
+        """Updates applied before and after a failing one are still saved."""
+        self._create_env_with_base_pkg("test_env")
+        server_config = {"name": "base_pkg", "command": "python", "args": []}
+        get_host_config_path = self.env_manager._get_host_config_path
+
+        def failing_for_cursor(hostname):
+            if hostname == "cursor":
+                raise RuntimeError("cursor failed")
+            return get_host_config_path(hostname)
+
+        with patch.object(
+            self.env_manager, "_get_host_config_path", side_effect=failing_for_cursor
+        ), patch.object(
+            self.env_manager,
+            "_save_environments",
+            wraps=self.env_manager._save_environments,
+        ) as mock_save:
+            updated = self.env_manager.batch_update_package_host_configurations(
+                "test_env",
+                [
+                    ("base_pkg", "claude-desktop", server_config),
+                    ("base_pkg", "cursor", server_config),
+                    ("base_pkg", "vscode", server_config),
+                ],
+            )
+
+        self.assertEqual(updated, 2)
+        mock_save.assert_called_once()
+        self.assertEqual(
+            set(self._configured_hosts("test_env")), {"claude-desktop", "vscode"}
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,10 @@
 """Unit tests for MCP Host Adapter protocol compliance.
 
-Test IDs: AP-01 to AP-06 (per 02-test_architecture_rebuild_v0.md)
+Test IDs: AP-01 to AP-07 (per 02-test_architecture_rebuild_v0.md)
 Scope: Verify all adapters satisfy BaseAdapter protocol contract.
 """
 
+import contextvars
 import unittest
 
 from hatch.mcp_host_config.models import MCPServerConfig, MCPHostType
@@ -19,6 +20,7 @@ from hatch.mcp_host_config.adapters import (
     MistralVibeAdapter,
     VSCodeAdapter,
 )
+from hatch.mcp_host_config.adapters.base import AdapterValidationError, current_host
 from hatch.mcp_host_config.adapters.opencode import OpenCodeAdapter
 
 # All adapter classes to test
@@ -141,6 +143,298 @@ class TestAdapterProtocol(unittest.TestCase):
                     f"get_adapter({host_type}) returned {type(adapter)}, expected {expected_cls}",
                 )
 
+    def test_AP07_adapters_have_no_instance_dict(self):
+        """AP-07: Built-in adapters declare __slots__ throughout their hierarchy."""
+        for adapter_cls in ALL_ADAPTERS:
+            with self.subTest(adapter=adapter_cls.__name__):
+                self.assertFalse(hasattr(adapter_cls(), "__dict__"))
+
+
+class TestFilterFields(unittest.TestCase):
+    """Tests for BaseAdapter.filter_fields() dump and result reuse."""
+
+    def test_dump_reused_across_adapters(self):
+        """Filtering one config for several hosts reads its fields only once."""
+        config = MCPServerConfig(name="test", command="python", args=["s.py"])
+
+        ClaudeAdapter().filter_fields(config)
+        dumped = config._dump_cache
+        results = [adapter().filter_fields(config) for adapter in ALL_ADAPTERS]
+
+        self.assertIs(config._dump_cache, dumped)
+        for adapter, filtered in zip(ALL_ADAPTERS, results):
+            self.assertNotIn("name", filtered, adapter.__name__)
+
+    def test_dump_matches_model_dump(self):
+        """Field values, including extra fields, match model_dump(exclude_none)."""
+        config = MCPServerConfig(
+            name="test",
+            command="python",
+            env={"KEY": "value"},
+            futureField={"nested": [1, 2]},
+            unsetExtra=None,
+        )
+
+        ClaudeAdapter().filter_fields(config)
+
+        self.assertEqual(config._dump_cache, config.model_dump(exclude_none=True))
+
+    def test_shared_field_set_reuses_filtered_view(self):
+        """Adapters with the same field set get equal, independent results."""
+        config = MCPServerConfig(name="test", command="python", args=["s.py"])
+
+        desktop = ClaudeAdapter(variant="desktop").filter_fields(config)
+        desktop["command"] = "changed"
+        code = ClaudeAdapter(variant="code").filter_fields(config)
+
+        self.assertEqual(code, {"command": "python", "args": ["s.py"]})
+        self.assertEqual(len({id(v) for v in config._filter_cache.values()}), 1)
+
+    def test_universal_only_config_filtered_once_for_all_hosts(self):
+        """Configs with only universal fields share one view across hosts."""
+        config = MCPServerConfig(
+            name="test", command="python", args=["s.py"], env={"KEY": "value"}
+        )
+
+        results = [adapter().filter_fields(config) for adapter in ALL_ADAPTERS]
+
+        expected = {"command": "python", "args": ["s.py"], "env": {"KEY": "value"}}
+        for adapter, filtered in zip(ALL_ADAPTERS, results):
+            if adapter is MistralVibeAdapter:
+                # Vibe adds its derived transport on top of the shared view
+                self.assertEqual(filtered.pop("transport"), "stdio")
+            self.assertEqual(filtered, expected, adapter.__name__)
+        self.assertEqual(len({id(v) for v in config._filter_cache.values()}), 1)
+
+    def test_host_specific_fields_filtered_per_host(self):
+        """A non-universal field is kept only for hosts that support it."""
+        config = MCPServerConfig(name="test", command="python", type="stdio")
+
+        self.assertEqual(
+            ClaudeAdapter().filter_fields(config),
+            {"command": "python", "type": "stdio"},
+        )
+        self.assertEqual(GeminiAdapter().filter_fields(config), {"command": "python"})
+
+    def test_field_assignment_refreshes_dump(self):
+        """Reassigning a field is reflected in the next filter_fields() call."""
+        adapter = ClaudeAdapter()
+        config = MCPServerConfig(name="test", command="python")
+        adapter.filter_fields(config)
+
+        config.command = "node"
+
+        self.assertEqual(adapter.filter_fields(config)["command"], "node")
+
+    def test_model_copy_does_not_reuse_dump(self):
+        """Copies with updated fields are filtered from their own values."""
+        adapter = ClaudeAdapter()
+        config = MCPServerConfig(name="test", command="python")
+        adapter.filter_fields(config)
+
+        copied = config.model_copy(update={"command": "node"})
+
+        self.assertEqual(adapter.filter_fields(copied)["command"], "node")
+        self.assertEqual(adapter.filter_fields(config)["command"], "python")
+
+    def test_mutating_output_leaves_config_and_cache_intact(self):
+        """Nested values of the returned dict are not shared."""
+        config = MCPServerConfig(
+            name="test", command="python", args=["s.py"], env={"KEY": "value"}
+        )
+
+        output = VSCodeAdapter().serialize(config)
+        output["args"].append("EVIL")
+        output["env"]["EVIL"] = "1"
+        CursorAdapter().filter_fields(config)["args"].append("EVIL")
+
+        self.assertEqual(config.args, ["s.py"])
+        self.assertEqual(config.env, {"KEY": "value"})
+        for adapter in (VSCodeAdapter(), CursorAdapter()):
+            self.assertEqual(adapter.serialize(config)["args"], ["s.py"])
+            self.assertEqual(adapter.serialize(config)["env"], {"KEY": "value"})
+
+    def test_reassigned_nested_value_is_serialized(self):
+        """Nested values are updated by assigning a new value, not in place."""
+        adapter = CursorAdapter()
+        config = MCPServerConfig(name="test", command="python", args=["a"])
+        adapter.serialize(config)
+
+        config.args = [*config.args, "b"]
+
+        self.assertEqual(adapter.serialize(config)["args"], ["a", "b"])
+
+
+class TestSerializeCache(unittest.TestCase):
+    """Tests for serialize() over the per-config dump and filter caches."""
+
+    def test_field_assignment_invalidates_output(self):
+        """Reassigning a field is validated and serialized again."""
+        adapter = ClaudeAdapter()
+        config = MCPServerConfig(name="test", command="python")
+        adapter.serialize(config)
+
+        config.command = None
+        config.url = "https://example.com/mcp"
+
+        self.assertEqual(
+            adapter.serialize(config),
+            {"url": "https://example.com/mcp", "type": "http"},
+        )
+
+    def test_invalid_config_raises_every_time(self):
+        """Validation failures are not cached."""
+        adapter = ClaudeAdapter()
+        config = MCPServerConfig(name="test", command="python")
+        config.url = "https://example.com/mcp"
+
+        for _ in range(2):
+            with self.assertRaises(AdapterValidationError):
+                adapter.serialize(config)
+
+    def test_serialize_many_matches_serialize(self):
+        """serialize_many() serializes each named config in order."""
+        adapter = CodexAdapter()
+        configs = {
+            "beta": MCPServerConfig(name="beta", command="node"),
+            "alpha": MCPServerConfig(name="alpha", command="python", args=["a.py"]),
+        }
+
+        result = adapter.serialize_many(configs)
+
+        self.assertEqual(list(result), ["beta", "alpha"])
+        for name, config in configs.items():
+            self.assertEqual(result[name], adapter.serialize(config))
+
+
+class TestTransportValidation(unittest.TestCase):
+    """Tests for the transport lookup tables used by validate_filtered()."""
+
+    TRANSPORTS = {
+        "command": "python",
+        "url": "https://example.com/mcp",
+        "httpUrl": "https://example.com/http",
+    }
+
+    def _combinations(self, fields):
+        for mask in range(2 ** len(fields)):
+            yield {
+                field: self.TRANSPORTS[field]
+                for bit, field in enumerate(fields)
+                if mask >> bit & 1
+            }
+
+    def test_single_transport_hosts_require_command_xor_url(self):
+        """Exactly one of command and url is accepted."""
+        adapter = CursorAdapter()
+        for filtered in self._combinations(["command", "url"]):
+            with self.subTest(fields=sorted(filtered)):
+                if len(filtered) == 1:
+                    adapter.validate_filtered(filtered)
+                else:
+                    with self.assertRaises(AdapterValidationError):
+                        adapter.validate_filtered(filtered)
+
+    def test_gemini_requires_exactly_one_of_three_transports(self):
+        """Gemini accepts exactly one of command, url and httpUrl."""
+        adapter = GeminiAdapter()
+        for filtered in self._combinations(["command", "url", "httpUrl"]):
+            with self.subTest(fields=sorted(filtered)):
+                if len(filtered) == 1:
+                    adapter.validate_filtered(filtered)
+                else:
+                    with self.assertRaises(AdapterValidationError):
+                        adapter.validate_filtered(filtered)
+
+    def test_type_must_match_transport(self):
+        """A 'type' naming the other transport is rejected on that field."""
+        adapter = ClaudeAdapter()
+        adapter.validate_filtered({"command": "python", "type": "stdio"})
+
+        with self.assertRaises(AdapterValidationError) as ctx:
+            adapter.validate_filtered({"command": "python", "type": "sse"})
+
+        self.assertEqual(ctx.exception.field, "type")
+        self.assertIn("type='sse' requires 'url' field", str(ctx.exception))
+
+
+class TestFieldMappings(unittest.TestCase):
+    """Tests for declarative FIELD_MAPPINGS renames."""
+
+    def test_adapters_without_mappings_pass_filtered_through(self):
+        """Hosts without mappings return the filtered dict unchanged."""
+        filtered = {"command": "python", "args": ["server.py"]}
+
+        self.assertIs(CursorAdapter().apply_transformations(filtered), filtered)
+
+    def test_codex_renames_declared_fields(self):
+        """Codex output uses host-native names from FIELD_MAPPINGS."""
+        config = MCPServerConfig(name="test", command="python", args=["server.py"])
+
+        result = CodexAdapter().serialize(config)
+
+        self.assertEqual(result, {"command": "python", "arguments": ["server.py"]})
+
+    def test_renamed_field_takes_precedence_over_native_name(self):
+        """A universal field wins over a host-native field it is renamed to."""
+        filtered = {
+            "url": "https://example.com/mcp",
+            "headers": {"X-Universal": "1"},
+            "http_headers": {"X-Native": "1"},
+        }
+
+        result = CodexAdapter().apply_transformations(filtered)
+
+        self.assertEqual(
+            list(result.items()),
+            [
+                ("url", "https://example.com/mcp"),
+                ("http_headers", {"X-Universal": "1"}),
+            ],
+        )
+
+    def test_opencode_nests_set_oauth_fields(self):
+        """OpenCode nests only the OAuth fields that are set, in key order."""
+        filtered = {
+            "url": "https://example.com/mcp",
+            "opencode_oauth_scope": "read",
+            "oauth_clientId": "client",
+            "oauth_clientSecret": "",
+        }
+
+        result = OpenCodeAdapter.to_native_format(filtered)
+
+        self.assertEqual(
+            list(result["oauth"].items()), [("clientId", "client"), ("scope", "read")]
+        )
+
+
+class TestAdapterValidationError(unittest.TestCase):
+    """Tests for host attribution of AdapterValidationError."""
+
+    def test_host_name_defaults_to_current_host(self):
+        """Errors raised without a host name use current_host when set."""
+
+        def raise_in_host():
+            current_host.set("cursor")
+            return AdapterValidationError("bad", field="url")
+
+        error = contextvars.copy_context().run(raise_in_host)
+
+        self.assertEqual(error.host_name, "cursor")
+        self.assertEqual(str(error), "[cursor] Field 'url': bad")
+        self.assertIsNone(AdapterValidationError("bad").host_name)
+
+    def test_explicit_host_name_wins(self):
+        """An explicit host_name is never replaced by current_host."""
+        token = current_host.set("cursor")
+        try:
+            error = AdapterValidationError("bad", host_name="kiro")
+        finally:
+            current_host.reset(token)
+
+        self.assertEqual(error.host_name, "kiro")
+
 
 if __name__ == "__main__":
     unittest.main()
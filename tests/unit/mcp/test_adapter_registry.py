@@ -4,7 +4,10 @@ Test IDs: AR-01 to AR-08 (per 02-test_architecture_rebuild_v0.md)
 Scope: Registry initialization, adapter lookup, registration.
 """
 
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from hatch.mcp_host_config.adapters import (
     AdapterRegistry,
@@ -133,6 +136,56 @@ class TestAdapterRegistry(unittest.TestCase):
 
         self.assertFalse(self.registry.has_adapter("claude-desktop"))
 
+    def test_supported_hosts_follow_registration_changes(self):
+        """get_supported_hosts() reflects unregister() and re-register()."""
+        hosts = self.registry.get_supported_hosts()
+        hosts.append("not-a-host")
+        adapter = self.registry.get_adapter("kiro")
+
+        self.registry.unregister("kiro")
+        self.assertNotIn("kiro", self.registry.get_supported_hosts())
+        self.assertNotIn("not-a-host", self.registry.get_supported_hosts())
+
+        self.registry.register(adapter)
+        hosts = self.registry.get_supported_hosts()
+        self.assertIn("kiro", hosts)
+        self.assertEqual(hosts, sorted(hosts))
+
+    def test_default_adapters_created_on_first_lookup(self):
+        """Built-in adapters are instantiated once, when first requested."""
+        self.assertNotIn("gemini", self.registry._adapters)
+        self.assertTrue(self.registry.has_adapter("gemini"))
+
+        adapter = self.registry.get_adapter("gemini")
+
+        self.assertIsInstance(adapter, GeminiAdapter)
+        self.assertIs(self.registry.get_adapter("gemini"), adapter)
+
+    def test_concurrent_first_lookup_creates_one_adapter(self):
+        """Threads racing on a built-in host share a single adapter instance."""
+        calls = []
+        calls_lock = threading.Lock()
+
+        def slow_factory():
+            with calls_lock:
+                calls.append(None)
+            time.sleep(0.01)
+            return GeminiAdapter()
+
+        self.registry._factories["gemini"] = slow_factory
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            adapters = list(
+                executor.map(lambda _: self.registry.get_adapter("gemini"), range(8))
+            )
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(adapter is adapters[0] for adapter in adapters))
+
+    def test_register_rejects_unloaded_default_host(self):
+        """A built-in host that is not instantiated yet still counts as registered."""
+        with self.assertRaises(ValueError):
+            self.registry.register(GeminiAdapter())
+
     def test_unregister_raises_for_unknown(self):
         """unregister() raises KeyError for unknown host."""
         with self.assertRaises(KeyError):
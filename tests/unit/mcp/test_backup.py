@@ -0,0 +1,125 @@
+"""Unit tests for MCP host configuration backups and atomic writes."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from hatch.mcp_host_config.backup import (
+    AtomicFileOperations,
+    BackupError,
+    MCPHostConfigBackupManager,
+)
+
+
+class TestAtomicWriteWithBackup(unittest.TestCase):
+    """Tests for AtomicFileOperations.atomic_write_with_backup()."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.config_path = root / "mcp.json"
+        self.config_path.write_text(json.dumps({"servers": {"old": {}}}))
+        self.backup_manager = MCPHostConfigBackupManager(backup_root=root / "backups")
+        self.atomic_ops = AtomicFileOperations()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _backups(self):
+        return list((self.backup_manager.backup_root / "kiro").iterdir())
+
+    def test_backup_keeps_previous_content(self):
+        """The backup holds the old content; the config holds the new one."""
+        self.atomic_ops.atomic_write_with_backup(
+            self.config_path, {"servers": {"new": {}}}, self.backup_manager, "kiro"
+        )
+
+        (backup,) = self._backups()
+        self.assertEqual(json.loads(backup.read_text()), {"servers": {"old": {}}})
+        self.assertEqual(
+            json.loads(self.config_path.read_text()), {"servers": {"new": {}}}
+        )
+        # The backup no longer shares storage with the live config file
+        self.assertEqual(backup.stat().st_nlink, 1)
+
+    def test_backup_falls_back_to_copy_without_hard_links(self):
+        """Filesystems without hard links get a copied backup."""
+        with patch("hatch.mcp_host_config.backup.os.link", side_effect=OSError):
+            self.atomic_ops.atomic_write_with_backup(
+                self.config_path, {"servers": {}}, self.backup_manager, "kiro"
+            )
+
+        (backup,) = self._backups()
+        self.assertEqual(json.loads(backup.read_text()), {"servers": {"old": {}}})
+
+    def test_non_ascii_written_as_utf8(self):
+        """Non-ASCII values are written as UTF-8 and read back unchanged."""
+        data = {"servers": {"météo": {"args": ["ünïcode"]}}}
+
+        self.atomic_ops.atomic_write_with_backup(
+            self.config_path, data, self.backup_manager, "kiro", skip_backup=True
+        )
+
+        self.assertEqual(json.loads(self.config_path.read_text(encoding="utf-8")), data)
+        self.assertIn("météo".encode("utf-8"), self.config_path.read_bytes())
+
+    def test_serializer_file_mode(self):
+        """Serializers get a binary file when requested, else a text file."""
+        self.atomic_ops.atomic_write_with_serializer(
+            self.config_path,
+            "ß",
+            lambda data, f: f.write(data.encode("utf-8")),
+            self.backup_manager,
+            "kiro",
+            skip_backup=True,
+            binary=True,
+        )
+        self.assertEqual(self.config_path.read_text(encoding="utf-8"), "ß")
+
+        self.atomic_ops.atomic_write_with_serializer(
+            self.config_path,
+            "é",
+            lambda data, f: f.write(data),
+            self.backup_manager,
+            "kiro",
+            skip_backup=True,
+        )
+        self.assertEqual(self.config_path.read_text(encoding="utf-8"), "é")
+
+    def test_serialization_failure_leaves_config_untouched(self):
+        """A failing serializer neither modifies the config nor backs it up."""
+        with self.assertRaises(BackupError):
+            self.atomic_ops.atomic_write_with_backup(
+                self.config_path, {"bad": object()}, self.backup_manager, "kiro"
+            )
+
+        self.assertEqual(
+            json.loads(self.config_path.read_text()), {"servers": {"old": {}}}
+        )
+        self.assertFalse(self.config_path.with_suffix(".json.tmp").exists())
+        self.assertFalse((self.backup_manager.backup_root / "kiro").exists())
+
+    def test_replace_failure_restores_and_drops_linked_backup(self):
+        """A failed replace restores the backup and leaves no linked backup."""
+        with patch.object(
+            self.backup_manager, "restore_backup"
+        ) as mock_restore, patch.object(Path, "replace", side_effect=OSError):
+            with self.assertRaises(BackupError):
+                self.atomic_ops.atomic_write_with_backup(
+                    self.config_path, {"servers": {}}, self.backup_manager, "kiro"
+                )
+
+        mock_restore.assert_called_once()
+        self.assertEqual(mock_restore.call_args.args[0], "kiro")
+        self.assertEqual(self._backups(), [])
+        self.assertEqual(self.config_path.stat().st_nlink, 1)
+        self.assertEqual(
+            json.loads(self.config_path.read_text()), {"servers": {"old": {}}}
+        )
+        self.assertFalse(self.config_path.with_suffix(".json.tmp").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,9 +5,19 @@ Scope: Unified model validation, field defaults, transport configuration.
 """
 
 import unittest
+from datetime import datetime
+
 from pydantic import ValidationError
 
-from hatch.mcp_host_config.models import MCPServerConfig
+from hatch.mcp_host_config.adapters import get_adapter
+from hatch.mcp_host_config.models import (
+    EnvironmentPackageEntry,
+    HostConfiguration,
+    MCPHostType,
+    MCPServerConfig,
+    PackageHostConfiguration,
+    parse_server_configs,
+)
 
 
 class TestMCPServerConfig(unittest.TestCase):
@@ -110,6 +120,13 @@ class TestMCPServerConfig(unittest.TestCase):
 
         self.assertEqual(config.command, "python")
 
+    def test_command_values_shared_across_configs(self):
+        """Equal commands from separate configs are the same string object."""
+        first = MCPServerConfig(name="a", command="".join(["my-", "server"]))
+        second = MCPServerConfig(name="b", command="  my-server ")
+
+        self.assertIs(first.command, second.command)
+
     def test_command_empty_rejected(self):
         """Test empty command (after stripping) is rejected."""
         with self.assertRaises(ValidationError):
@@ -154,6 +171,138 @@ class TestMCPServerConfigProperties(unittest.TestCase):
         config = MCPServerConfig(name="test", httpUrl="https://example.com/http")
         self.assertTrue(config.is_remote_server)
 
+    def test_transport_type_recomputed_after_assignment(self):
+        """The cached transport type follows field reassignment."""
+        config = MCPServerConfig(name="test", command="python")
+        self.assertEqual(config.get_transport_type(), "stdio")
+
+        config.command = None
+        config.url = "https://example.com/mcp"
+
+        self.assertEqual(config.get_transport_type(), "sse")
+        copied = config.model_copy(update={"type": "http"})
+        self.assertEqual(copied.get_transport_type(), "http")
+
+    def test_equality_ignores_cached_values(self):
+        """Serializing or querying a config does not affect equality."""
+        config = MCPServerConfig(name="test", command="python", args=["server.py"])
+        other = MCPServerConfig(name="test", command="python", args=["server.py"])
+
+        get_adapter("vscode").serialize(config)
+        self.assertEqual(config, other)
+
+        other.get_transport_type()
+        self.assertEqual(config, other)
+        self.assertNotEqual(config, MCPServerConfig(name="test", command="node"))
+
+
+class TestHostConfiguration(unittest.TestCase):
+    """Tests for HostConfiguration server storage."""
+
+    def test_server_configs_stored_without_copy(self):
+        """Validated configs are kept as-is, at construction and via add_server()."""
+        alpha = MCPServerConfig(name="alpha", command="python")
+        beta = MCPServerConfig(name="beta", url="https://example.com/mcp")
+
+        host_config = HostConfiguration(servers={"alpha": alpha})
+        host_config.add_server("beta", beta)
+
+        self.assertIs(host_config.servers["alpha"], alpha)
+        self.assertIs(host_config.servers["beta"], beta)
+
+    def test_invalid_server_entry_rejected(self):
+        """Entries that are not server configs fail validation."""
+        with self.assertRaises(ValidationError):
+            HostConfiguration(servers={"alpha": 5})
+
+
+class TestParseServerConfigs(unittest.TestCase):
+    """Tests for parse_server_configs() batch validation."""
+
+    def test_valid_entries_parsed_in_batch(self):
+        """All valid entries are returned as MCPServerConfig objects."""
+        servers = parse_server_configs(
+            {
+                "local": {"command": "python", "args": ["server.py"]},
+                "remote": {"url": "https://example.com/mcp"},
+            }
+        )
+
+        self.assertEqual(list(servers), ["local", "remote"])
+        self.assertEqual(servers["local"].args, ["server.py"])
+        self.assertTrue(servers["remote"].is_remote_server)
+
+    def test_invalid_entry_skipped_without_dropping_others(self):
+        """An invalid entry is skipped with a warning; valid ones are kept."""
+        with self.assertLogs("hatch.mcp_host_config.models", "WARNING") as logs:
+            servers = parse_server_configs(
+                {"good": {"command": "python"}, "bad": {"args": ["no-transport"]}}
+            )
+
+        self.assertEqual(list(servers), ["good"])
+        self.assertIn("bad", logs.output[0])
+
+
+class TestEnvironmentPackageEntry(unittest.TestCase):
+    """Tests for EnvironmentPackageEntry name and host validation."""
+
+    def _entry(self, *hosts, name="weather"):
+        now = datetime.now()
+        host_config = PackageHostConfiguration(
+            config_path="/tmp/mcp.json",
+            configured_at=now,
+            last_synced=now,
+            server_config=MCPServerConfig(name="weather", command="python"),
+        )
+        return EnvironmentPackageEntry(
+            name=name,
+            version="1.0.0",
+            type="hatch",
+            source="registry",
+            installed_at=now,
+            configured_hosts={host: host_config for host in hosts},
+        )
+
+    def test_package_name_format(self):
+        """Names need a letter or digit and may use '-', '_' and '.'."""
+        for name in ("weather", "my-pkg_2.0", "météo"):
+            with self.subTest(name=name):
+                self.assertEqual(self._entry(name=name).name, name)
+
+        for name in ("-_.", "my pkg", "pkg/../x"):
+            with self.subTest(name=name):
+                with self.assertRaises(ValidationError):
+                    self._entry(name=name)
+
+    def test_every_host_type_accepted(self):
+        """All MCPHostType values are valid configured host names."""
+        entry = self._entry(*(host.value for host in MCPHostType))
+
+        self.assertEqual(len(entry.configured_hosts), len(MCPHostType))
+
+    def test_config_paths_shared_across_packages(self):
+        """Equal config paths from separate records are one string object."""
+        now = datetime.now()
+        server_config = MCPServerConfig(name="weather", command="python")
+        first, second = (
+            PackageHostConfiguration(
+                config_path=path,
+                configured_at=now,
+                last_synced=now,
+                server_config=server_config,
+            )
+            for path in ("".join(["/tmp/", "mcp.json"]), " /tmp/mcp.json ")
+        )
+
+        self.assertIs(first.config_path, second.config_path)
+
+    def test_unknown_host_rejected(self):
+        """The first unsupported host name is reported."""
+        with self.assertRaises(ValidationError) as context:
+            self._entry("cursor", "not-a-host")
+
+        self.assertIn("Unsupported host: not-a-host", str(context.exception))
+
 
 if __name__ == "__main__":
     unittest.main()
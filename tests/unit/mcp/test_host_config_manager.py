@@ -0,0 +1,246 @@
+"""Unit tests for MCPHostConfigurationManager batch configuration and sync."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from hatch.mcp_host_config.adapters.base import current_host
+from hatch.mcp_host_config.host_management import MCPHostConfigurationManager
+from hatch.mcp_host_config.models import HostConfiguration, MCPServerConfig
+
+
+def _make_manager(valid=lambda config: True, write_result=True):
+    """Create a manager whose registry returns a mock strategy."""
+    strategy = MagicMock()
+    strategy.validate_server_config.side_effect = valid
+    strategy.read_configuration.return_value = HostConfiguration()
+    strategy.write_configuration.return_value = write_result
+
+    manager = MCPHostConfigurationManager(backup_manager=MagicMock())
+    manager.host_registry = MagicMock()
+    manager.host_registry.get_strategy.return_value = strategy
+    return manager, strategy
+
+
+class TestConfigureServers(unittest.TestCase):
+    """Verify configure_servers() batches host file access."""
+
+    def setUp(self):
+        self.configs = [
+            MCPServerConfig(name="alpha", command="python", args=["alpha.py"]),
+            MCPServerConfig(name="beta", command="python", args=["beta.py"]),
+        ]
+
+    def test_single_read_and_write_for_all_servers(self):
+        """All servers are added in one read/write cycle."""
+        manager, strategy = _make_manager()
+
+        results = manager.configure_servers(
+            server_configs=self.configs, hostname="cursor", no_backup=True
+        )
+
+        self.assertEqual([r.server_name for r in results], ["alpha", "beta"])
+        self.assertTrue(all(r.success for r in results))
+        strategy.read_configuration.assert_called_once()
+        strategy.write_configuration.assert_called_once()
+        written = strategy.write_configuration.call_args.args[0]
+        self.assertEqual(set(written.servers), {"alpha", "beta"})
+
+    def test_invalid_config_reported_without_blocking_others(self):
+        """Invalid servers fail individually; valid ones are still written."""
+        manager, strategy = _make_manager(valid=lambda config: config.name != "beta")
+
+        results = manager.configure_servers(
+            server_configs=self.configs, hostname="cursor", no_backup=True
+        )
+
+        self.assertTrue(results[0].success)
+        self.assertFalse(results[1].success)
+        self.assertIn("invalid", results[1].error_message)
+        written = strategy.write_configuration.call_args.args[0]
+        self.assertEqual(set(written.servers), {"alpha"})
+
+    def test_server_rejected_by_adapter_fails_alone(self):
+        """A server the host's adapter rejects does not block the others."""
+        manager, strategy = _make_manager()
+        configs = [
+            MCPServerConfig(name="good", command="python"),
+            MCPServerConfig(name="bad", command="python", url="https://example.com"),
+        ]
+
+        results = manager.configure_servers(
+            server_configs=configs, hostname="cursor", no_backup=True
+        )
+
+        self.assertTrue(results[0].success)
+        self.assertFalse(results[1].success)
+        self.assertIn("Cannot specify both", results[1].error_message)
+        written = strategy.write_configuration.call_args.args[0]
+        self.assertEqual(set(written.servers), {"good"})
+
+    def test_unknown_host_fails_every_server(self):
+        """An unknown host yields one failed result per server."""
+        manager = MCPHostConfigurationManager(backup_manager=MagicMock())
+
+        results = manager.configure_servers(
+            server_configs=self.configs, hostname="not-a-host"
+        )
+
+        self.assertEqual(len(results), 2)
+        self.assertFalse(any(r.success for r in results))
+
+
+class TestSyncConfigurations(unittest.TestCase):
+    """Verify sync_configurations() across several target hosts."""
+
+    def _make_sync_manager(self, failing_host=None, on_write=None):
+        """Create a manager with one mock strategy per host."""
+        source = HostConfiguration(
+            servers={
+                "alpha": MCPServerConfig(name="alpha", command="python"),
+                "beta": MCPServerConfig(name="beta", command="node"),
+            }
+        )
+        strategies = {}
+
+        def get_strategy(host_type):
+            if host_type.value not in strategies:
+                strategy = MagicMock()
+                strategy.read_configuration.return_value = (
+                    source
+                    if host_type.value == "claude-desktop"
+                    else HostConfiguration()
+                )
+                if host_type.value == failing_host:
+                    strategy.write_configuration.side_effect = OSError("disk full")
+                elif on_write is not None:
+                    strategy.write_configuration.side_effect = on_write
+                else:
+                    strategy.write_configuration.return_value = True
+                strategies[host_type.value] = strategy
+            return strategies[host_type.value]
+
+        manager = MCPHostConfigurationManager(backup_manager=MagicMock())
+        manager.host_registry = MagicMock()
+        manager.host_registry.get_strategy.side_effect = get_strategy
+        return manager, strategies
+
+    def test_results_follow_target_host_order(self):
+        """Each target host is written once and reported in the given order."""
+        manager, strategies = self._make_sync_manager()
+
+        result = manager.sync_configurations(
+            from_host="claude-desktop",
+            to_hosts=["cursor", "vscode", "cursor", "kiro"],
+            no_backup=True,
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(
+            [r.hostname for r in result.results], ["cursor", "vscode", "kiro"]
+        )
+        self.assertEqual(result.hosts_updated, 3)
+        self.assertEqual(result.servers_synced, 6)
+        for host in ("cursor", "vscode", "kiro"):
+            strategies[host].write_configuration.assert_called_once()
+
+    def test_failing_host_does_not_affect_others(self):
+        """A write error on one host is reported without failing the rest."""
+        manager, _ = self._make_sync_manager(failing_host="vscode")
+
+        result = manager.sync_configurations(
+            from_host="claude-desktop", to_hosts=["cursor", "vscode"], no_backup=True
+        )
+
+        self.assertTrue(result.results[0].success)
+        self.assertFalse(result.results[1].success)
+        self.assertEqual(result.results[1].error_message, "disk full")
+        self.assertEqual(result.servers_synced, 2)
+        self.assertEqual(result.failed_hosts, ["vscode"])
+        self.assertEqual(result.success_rate, 50.0)
+
+    def test_invalid_host_rejected_before_any_file_access(self):
+        """Unknown target hosts fail up front and keep their position."""
+        manager, strategies = self._make_sync_manager()
+
+        result = manager.sync_configurations(
+            from_host="claude-desktop",
+            to_hosts=["not-a-host", "cursor"],
+            no_backup=True,
+        )
+
+        self.assertEqual([r.hostname for r in result.results], ["not-a-host", "cursor"])
+        self.assertEqual(
+            result.results[0].error_message, "Invalid target host 'not-a-host'"
+        )
+        self.assertTrue(result.results[1].success)
+        self.assertEqual(set(strategies), {"claude-desktop", "cursor"})
+
+    def test_current_host_set_per_target_host(self):
+        """Each host is written with current_host naming that host."""
+        seen = []
+
+        def on_write(config, no_backup=False):
+            seen.append(current_host.get(None))
+            return True
+
+        manager, _ = self._make_sync_manager(on_write=on_write)
+
+        result = manager.sync_configurations(
+            from_host="claude-desktop", to_hosts=["cursor", "vscode"], no_backup=True
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(sorted(seen), ["cursor", "vscode"])
+        self.assertIsNone(current_host.get(None))
+
+    def test_sync_from_environment_skips_invalid_server_configs(self):
+        """Environment server configs are validated; invalid ones are skipped."""
+        manager, strategies = self._make_sync_manager()
+        env_data = {
+            "packages": [
+                {"name": "no-mcp", "configured_hosts": {}},
+                {
+                    "name": "weather",
+                    "configured_hosts": {
+                        "claude-desktop": {
+                            "config_path": "/tmp/claude.json",
+                            "server_config": {
+                                "name": "weather",
+                                "command": "python",
+                                "args": ["weather.py"],
+                            },
+                        }
+                    },
+                },
+                {
+                    # Tracking data of a remote server without its URL
+                    "name": "remote",
+                    "configured_hosts": {
+                        "claude-desktop": {
+                            "config_path": "/tmp/claude.json",
+                            "server_config": {"name": "remote", "args": []},
+                        }
+                    },
+                },
+            ]
+        }
+
+        with patch(
+            "hatch.environment_manager.HatchEnvironmentManager"
+        ) as mock_env_manager, self.assertLogs(
+            "hatch.mcp_host_config.host_management", level="WARNING"
+        ) as logs:
+            mock_env_manager.return_value.get_environment_data.return_value = env_data
+            result = manager.sync_configurations(
+                from_env="default", to_hosts=["cursor"], no_backup=True
+            )
+
+        self.assertTrue(result.success)
+        written = strategies["cursor"].write_configuration.call_args.args[0]
+        self.assertEqual(list(written.servers), ["weather"])
+        self.assertEqual(written.servers["weather"].args, ["weather.py"])
+        self.assertIn("remote on claude-desktop", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Unit tests for host configuration JSON encoding."""
+
+import json
+import unittest
+from unittest.mock import patch
+
+from hatch.mcp_host_config import json_io
+from hatch.mcp_host_config.json_io import dumps_json
+
+
+class TestDumpsJson(unittest.TestCase):
+    """Tests for dumps_json() with and without orjson."""
+
+    def setUp(self):
+        self.data = {"mcpServers": {"café": {"command": "python", "args": []}}}
+
+    def test_round_trip_with_default_encoder(self):
+        """Encoded output parses back to the same data as UTF-8 JSON."""
+        encoded = dumps_json(self.data)
+
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json.loads(encoded.decode("utf-8")), self.data)
+        self.assertIn('\n  "mcpServers"', encoded.decode("utf-8"))
+
+    def test_stdlib_fallback_matches_indent_and_encoding(self):
+        """Without orjson the stdlib encoder produces the same document."""
+        with patch.object(json_io, "orjson", None):
+            encoded = dumps_json(self.data)
+
+        self.assertEqual(
+            encoded, json.dumps(self.data, indent=2, ensure_ascii=False).encode()
+        )
+
+    def test_data_rejected_by_orjson_uses_stdlib(self):
+        """Data orjson cannot encode (non-str keys) still serializes."""
+        encoded = dumps_json({1: "one"})
+
+        self.assertEqual(json.loads(encoded), {"1": "one"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Unit tests for MCP conversion report generation."""
+
+import unittest
+
+from hatch.mcp_host_config.models import MCPHostType, MCPServerConfig
+from hatch.mcp_host_config.reporting import generate_conversion_report
+
+
+class TestGenerateConversionReport(unittest.TestCase):
+    """Tests for generate_conversion_report() field classification."""
+
+    def _operations(self, report):
+        return {op.field_name: op for op in report.field_operations}
+
+    def test_update_compares_against_old_config(self):
+        """Changed, unchanged and newly set fields are classified per field."""
+        old_config = MCPServerConfig(name="srv", command="python", args=["a.py"])
+        config = MCPServerConfig(
+            name="srv", command="python", args=["b.py"], env={"KEY": "value"}
+        )
+
+        report = generate_conversion_report(
+            operation="update",
+            server_name="srv",
+            target_host=MCPHostType.CLAUDE_DESKTOP,
+            config=config,
+            old_config=old_config,
+        )
+        operations = self._operations(report)
+
+        self.assertNotIn("name", operations)
+        self.assertEqual(operations["command"].operation, "UNCHANGED")
+        self.assertEqual(operations["args"].operation, "UPDATED")
+        self.assertEqual(operations["args"].old_value, ["a.py"])
+        self.assertEqual(operations["env"].operation, "UPDATED")
+        self.assertIsNone(operations["env"].old_value)
+
+    def test_unsupported_fields_reported(self):
+        """Fields the target host does not support are marked UNSUPPORTED."""
+        config = MCPServerConfig(name="srv", command="python", trust=True)
+
+        report = generate_conversion_report(
+            operation="create",
+            server_name="srv",
+            target_host=MCPHostType.CLAUDE_DESKTOP,
+            config=config,
+        )
+        operations = self._operations(report)
+
+        self.assertEqual(operations["command"].operation, "UPDATED")
+        self.assertEqual(operations["trust"].operation, "UNSUPPORTED")
+
+
+if __name__ == "__main__":
+    unittest.main()